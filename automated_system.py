@@ -15,9 +15,6 @@ from pathlib import Path
 import traceback
 from typing import List, Dict
 
-# Add the project root to Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 
 try:
     from trading_system import TradingSystem, StockLists
@@ -155,6 +152,8 @@ class EnhancedAutomatedTradingSystem:
             # Try to load existing session first
             if self.session_manager.auto_manage_session(self.wb):
                 self.logger.info("✅ Using existing session")
+                # Loading the session already re-initialized the account context
+                self.login_manager.mark_verified()
                 # Verify login status and ensure account context is properly initialized
                 if self.login_manager.check_login_status():
                     self.is_logged_in = True
@@ -179,8 +178,8 @@ class EnhancedAutomatedTradingSystem:
                 self.logger.info("✅ Enhanced day trading protection initialized")                               
                 
                 
-                # Save the new session
-                self.session_manager.save_session(self.wb)
+                # Save the new session and prune old session backups
+                self.session_manager.save_and_cleanup(self.wb)
                 return True
             else:
                 self.logger.error("❌ CRITICAL: Authentication failed after all retries")
@@ -229,7 +228,7 @@ class EnhancedAutomatedTradingSystem:
                 self.logger.info(f"   Positions: {len(account.positions)}")
                 
                 # Day trading info
-                if hasattr(account, 'day_trades_remaining') and account.day_trades_remaining is not None:
+                if account.day_trades_remaining is not None:
                     if account.account_type in ['Cash Account', 'CASH']:
                         self.logger.info(f"   Day Trading: ✅ Unlimited (Cash Account)")
                     elif account.day_trades_remaining >= 999:
@@ -342,7 +341,7 @@ class EnhancedAutomatedTradingSystem:
         total_settled_funds = 0.0
         
         for account in self.trading_accounts:
-            position_symbols = [pos['symbol'] for pos in account.positions]
+            position_symbols = [pos.symbol for pos in account.positions]
             all_position_symbols.update(position_symbols)
             total_settled_funds += account.settled_funds
         
@@ -359,7 +358,7 @@ class EnhancedAutomatedTradingSystem:
     def filter_signals_for_account(self, signals: List[Dict], account: AccountInfo) -> List[Dict]:
         """Filter signals for specific account using ENHANCED PersonalTradingConfig rule enforcement"""
         filtered_signals = []
-        position_symbols = [pos['symbol'] for pos in account.positions]
+        position_symbols = [pos.symbol for pos in account.positions]
         account_trades = [t for t in self.todays_trades if t.get('account_id') == account.account_id]
         
         # Check per-account trade limit using PersonalTradingConfig (AUTHORITATIVE)
@@ -516,7 +515,7 @@ class EnhancedAutomatedTradingSystem:
                     # Find position to sell
                     position = None
                     for pos in account.positions:
-                        if pos['symbol'] == symbol:
+                        if pos.symbol == symbol:
                             position = pos
                             break
                     
@@ -524,7 +523,7 @@ class EnhancedAutomatedTradingSystem:
                         self.logger.warning(f"No position found for {symbol} - skipping sell")
                         return False
                     
-                    quantity = position['quantity']
+                    quantity = position.quantity
                     order_mode = 'fractional_shares' if quantity != int(quantity) else 'whole_shares'
                 
                 # Execute order with appropriate parameters
@@ -815,8 +814,8 @@ class EnhancedAutomatedTradingSystem:
                 
                 for account in self.trading_accounts:
                     for pos in account.positions:
-                        is_fractional = self.config.is_fractional_position(pos['quantity'])
-                        is_buy_and_hold = pos['symbol'] in self.config.BUY_AND_HOLD_POSITIONS
+                        is_fractional = self.config.is_fractional_position(pos.quantity)
+                        is_buy_and_hold = pos.symbol in self.config.BUY_AND_HOLD_POSITIONS
                         
                         conn.execute('''
                             INSERT OR REPLACE INTO enhanced_position_history
@@ -825,9 +824,9 @@ class EnhancedAutomatedTradingSystem:
                             account_value, settled_funds, is_fractional, is_buy_and_hold, enhanced_system)
                             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                         ''', (
-                            sync_date, account.account_id, account.account_type, pos['symbol'], pos['quantity'],
-                            pos['cost_price'], pos['current_price'], pos['market_value'], pos['unrealized_pnl'],
-                            pos['pnl_rate'], pos['last_open_time'], account.net_liquidation,
+                            sync_date, account.account_id, account.account_type, pos.symbol, pos.quantity,
+                            pos.cost_price, pos.current_price, pos.market_value, pos.unrealized_pnl,
+                            pos.pnl_rate, pos.last_open_time, account.net_liquidation,
                             account.settled_funds, 1 if is_fractional else 0, 1 if is_buy_and_hold else 0, 1
                         ))
                         total_positions_synced += 1
@@ -896,7 +895,7 @@ class EnhancedAutomatedTradingSystem:
                     
                     # Add account-specific day trading info
                     for account in self.trading_accounts:
-                        if hasattr(account, 'day_trades_remaining') and account.day_trades_remaining is not None:
+                        if account.day_trades_remaining is not None:
                             if account.account_type in ['Cash Account', 'CASH']:
                                 self.logger.info(f"   💰 {account.account_type}: Unlimited day trading (settled funds)")
                             elif account.day_trades_remaining >= 999:
@@ -1122,7 +1121,7 @@ class EnhancedAutomatedTradingSystem:
                 self.logger.info(f"      💸 Cash %: {allocation_info['cash_percentage']:.1f}%")
                 
                 # Enhanced day trading status
-                if hasattr(account, 'day_trades_remaining') and account.day_trades_remaining is not None:
+                if account.day_trades_remaining is not None:
                     if account.account_type in ['Cash Account', 'CASH']:
                         self.logger.info(f"      🔄 Day Trading: Unlimited (Cash)")
                     elif account.day_trades_remaining >= 999:
@@ -4,16 +4,12 @@ Temporary script to check what day trading information Webull provides
 This script can be deleted after we determine what data is available
 """
 
-import sys
 import os
 import json
 import logging
 from datetime import datetime
 from pprint import pprint
 
-# Add the project root to Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 from trading_system.webull.webull import webull
 from trading_system.auth import CredentialManager, LoginManager, SessionManager
 from trading_system.accounts import AccountManager
@@ -47,6 +43,8 @@ def check_day_trading_data():
         print("1. Attempting to authenticate...")
         
         if session_manager.auto_manage_session(wb):
+            # Loading the session already re-initialized the account context
+            login_manager.mark_verified()
             if login_manager.check_login_status():
                 print("✅ Using existing session")
             else:
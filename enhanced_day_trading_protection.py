@@ -505,7 +505,7 @@ class EnhancedAutomatedTradingSystemWithDayTradeProtection:
             # Use enhanced day trading check instead of basic one
             should_execute, reason = self.day_trade_protection.enhanced_should_execute_signal(
                 signal, 
-                current_positions=[pos['symbol'] for pos in account.positions],
+                current_positions=[pos.symbol for pos in account.positions],
                 account_value=account.net_liquidation,
                 account_id=account.account_id
             )
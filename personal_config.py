@@ -6,11 +6,46 @@ NO inheritance or dependencies on any other config files
 ALL configuration parameters are defined here
 """
 
+import json
 import os
+import sys
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Tuple, Any
 from trading_system.config.stock_lists import StockLists
 
+# Status markers for console output, resolved once against the stdout encoding
+_UTF8_STDOUT = (getattr(sys.stdout, 'encoding', None) or '').lower().replace('-', '').startswith('utf')
+_OK, _BAD, _WARN = ('✅', '❌', '⚠️') if _UTF8_STDOUT else ('[OK]', '[FAIL]', '[WARN]')
+_CONFIG_ICON, _SYSTEM_ICON, _SUMMARY_ICON = ('🔧 ', '🤖 ', '📋 ') if _UTF8_STDOUT else ('', '', '')
+_FUNDS_ICON, _SCAN_ICON = ('💰 ', '📊 ') if _UTF8_STDOUT else ('', '')
+_FRACTIONAL_MARK, _GAIN_MARK, _LOSS_MARK = ('📊', '🟢', '🔴') if _UTF8_STDOUT else ('[frac]', '[+]', '[-]')
+
+
+@lru_cache(maxsize=1024)
+def _validate_signal_shape(signal_type: str, requires_shorting: bool, is_day_trade: bool,
+                           allow_day_trading: bool) -> Tuple[str, ...]:
+    """Rule violations for a signal, keyed only on the fields the rules inspect"""
+    violations = []
+
+    # Check if signal type violates our rules
+    if signal_type not in ('BUY', 'SELL'):
+        violations.append(f"Invalid signal type: {signal_type}")
+
+    # Never allow SHORT signals
+    if signal_type == 'SHORT':
+        violations.append("SHORT SELLING BLOCKED: Short selling not allowed")
+
+    # Check for any short-selling indicators in metadata
+    if requires_shorting:
+        violations.append("STRATEGY BLOCKED: Strategy requires short selling")
+
+    # Check for day trading strategy indicators
+    if is_day_trade and not allow_day_trading:
+        violations.append("DAY TRADING BLOCKED: Strategy marked as day trade")
+
+    return tuple(violations)
+
 class PersonalTradingConfig:
     """
     STANDALONE COMPLETE TRADING CONFIGURATION
@@ -88,6 +123,9 @@ class PersonalTradingConfig:
     TRADING_START_TIME = "09:45"  # Wait 15 min after market open
     TRADING_END_TIME = "15:30"    # Stop 30 min before close
 
+    # Account Loading
+    PARALLEL_ACCOUNT_LOAD = True      # Fetch account details concurrently during discovery
+
     # Notification Preferences
     REQUIRE_CONFIRMATION = True       # Always ask before trading
     SHOW_DETAILED_ANALYSIS = True    # Show full signal details
@@ -435,37 +473,23 @@ class PersonalTradingConfig:
     @classmethod
     def validate_signal_against_rules(cls, signal) -> Tuple[bool, List[str]]: # Changed signal: Dict to signal
         """Comprehensive signal validation against all personal trading rules"""
-        violations = []
         signal_type = signal.signal_type # Changed signal.get('signal_type', '') to signal.signal_type
 
-        # Check if signal type violates our rules
-        if signal_type not in ['BUY', 'SELL']:
-            violations.append(f"Invalid signal type: {signal_type}")
-
-        # Never allow SHORT signals
-        if signal_type == 'SHORT':
-            violations.append("SHORT SELLING BLOCKED: Short selling not allowed")
-
         # Check for any strategy-specific rule violations
-        strategy = signal.strategy # Changed signal.get('strategy', '') to signal.strategy
         metadata = signal.metadata # Changed signal.get('metadata', '{}') to signal.metadata
+        requires_shorting = is_day_trade = False
 
         try:
-            import json
             metadata_dict = json.loads(metadata) if isinstance(metadata, str) else metadata
-
-            # Check for any short-selling indicators in metadata
-            if metadata_dict.get('requires_shorting', False):
-                violations.append("STRATEGY BLOCKED: Strategy requires short selling")
-
-            # Check for day trading strategy indicators
-            if metadata_dict.get('is_day_trade', False) and not cls.ALLOW_DAY_TRADING:
-                violations.append("DAY TRADING BLOCKED: Strategy marked as day trade")
-
+            requires_shorting = bool(metadata_dict.get('requires_shorting', False))
+            is_day_trade = bool(metadata_dict.get('is_day_trade', False))
         except (json.JSONDecodeError, TypeError):
             pass  # Ignore metadata parsing errors
 
-        return len(violations) == 0, violations
+        # Signals sharing the same rule-relevant shape hit the cached verdict
+        violations = _validate_signal_shape(signal_type, requires_shorting, is_day_trade,
+                                            cls.ALLOW_DAY_TRADING)
+        return len(violations) == 0, list(violations)
 
     @classmethod
     def should_execute_signal(cls, signal, current_positions=None, account_value=0.0,
@@ -541,7 +565,7 @@ class PersonalTradingConfig:
         min_order_affordable = settled_funds >= cls.MIN_FRACTIONAL_ORDER
 
         if min_order_affordable:
-            print(f"💰 Fractional shares enabled: All stocks affordable (${cls.MIN_FRACTIONAL_ORDER:.2f} min)")
+            print(f"{_FUNDS_ICON}Fractional shares enabled: All stocks affordable (${cls.MIN_FRACTIONAL_ORDER:.2f} min)")
 
             # Add stocks from all strategy universes based on VIX level and quality
 
@@ -564,14 +588,14 @@ class PersonalTradingConfig:
             scan_universe.extend(StockLists.MICROSTRUCTURE_UNIVERSE)
 
         else:
-            print(f"⚠️  Limited funds: ${settled_funds:.2f} < ${cls.MIN_FRACTIONAL_ORDER:.2f} minimum")
+            print(f"{_WARN}  Limited funds: ${settled_funds:.2f} < ${cls.MIN_FRACTIONAL_ORDER:.2f} minimum")
             print("   Only including current positions and watchlist")
 
         # Remove duplicates and sort
         scan_universe = list(set(scan_universe))
         scan_universe.sort()
 
-        print(f"📊 Scan universe: {len(scan_universe)} stocks (fractional-enabled)")
+        print(f"{_SCAN_ICON}Scan universe: {len(scan_universe)} stocks (fractional-enabled)")
 
         return scan_universe
 
@@ -752,23 +776,24 @@ class PersonalTradingConfig:
         price = signal.price # Changed signal['price'] to signal.price
         confidence = signal.confidence # Changed signal.get('confidence', 0) to signal.confidence
 
-        # Base display
-        display = f"{signal_type} {symbol} @ ${price:.2f} ({confidence:.1%})"
+        # Base display - suffixes are collected and joined once at the end
+        parts = [f"{signal_type} {symbol} @ ${price:.2f} ({confidence:.1%})"]
 
         # Add fractional indicator for buys
         if signal_type == 'BUY' and signal.fractional_order: # Changed signal.get('fractional_order', False) to signal.fractional_order
-            display += " 📊"  # Fractional indicator
+            parts.append(f" {_FRACTIONAL_MARK}")  # Fractional indicator
 
         # Add position info for sells
         if signal_type == 'SELL' and position_data:
             pnl = position_data.get('unrealized_pnl', 0)
             pnl_pct = position_data.get('pnl_rate', 0) * 100
-            pnl_emoji = "🟢" if pnl >= 0 else "🔴"
-            display += f" {pnl_emoji} P&L: ${pnl:+.2f} ({pnl_pct:+.1f}%)"
+            pnl_emoji = _GAIN_MARK if pnl >= 0 else _LOSS_MARK
+            parts.append(f" {pnl_emoji} P&L: ${pnl:+.2f} ({pnl_pct:+.1f}%)")
 
             # Add fractional indicator if it's a fractional position
-            if position_data.get('quantity', 1) != int(position_data.get('quantity', 1)):
-                display += " 📊"
+            quantity = position_data.get('quantity', 1)
+            if quantity != int(quantity):
+                parts.append(f" {_FRACTIONAL_MARK}")
 
         # Add strategy info if available
         if hasattr(signal, 'metadata'): # Changed 'metadata' in signal to hasattr(signal, 'metadata')
@@ -777,11 +802,11 @@ class PersonalTradingConfig:
                 metadata = signal.metadata # Changed json.loads(signal['metadata']) to signal.metadata
                 if hasattr(metadata, 'strategy_logic'): # Changed 'strategy_logic' in metadata to hasattr(metadata, 'strategy_logic')
                     strategy = metadata.strategy_logic.replace('_', ' ').title() # Changed metadata['strategy_logic'] to metadata.strategy_logic
-                    display += f" [{strategy}]"
+                    parts.append(f" [{strategy}]")
             except:
                 pass
 
-        return display
+        return ''.join(parts)
 
     @classmethod
     def get_rule_enforcement_summary(cls):
@@ -912,69 +937,75 @@ def validate_personal_config():
     """Validate personal configuration settings"""
     config = PersonalTradingConfig()
 
-    print("🔧 COMPLETE PERSONAL TRADING CONFIGURATION")
-    print("=" * 70)
-    print("✅ NO DEPENDENCIES - COMPLETE STANDALONE CONFIG")
-    print("✅ NO INHERITANCE - ALL PARAMETERS SELF-CONTAINED")
-    print("✅ SINGLE SOURCE OF TRUTH FOR ENTIRE SYSTEM")
-    print("✅ ALL MISSING METHODS INCLUDED")
-    print("=" * 70)
-
-    print(f"Short Selling: {'❌ BLOCKED' if not config.ALLOW_SHORT_SELLING else '✅ Enabled'}")
-    print(f"Day Trading: {'❌ BLOCKED' if not config.ALLOW_DAY_TRADING else '✅ Enabled'}")
-    print(f"Max Position: {config.MAX_POSITION_VALUE_PERCENT:.1%} of account")
-    print(f"Min Position: ${config.MIN_POSITION_VALUE}")
-    print(f"Max Positions: {config.MAX_POSITIONS_TOTAL}")
-    print(f"Stop Loss: {config.PERSONAL_STOP_LOSS:.1%}")
-    print(f"Take Profit: {config.PERSONAL_TAKE_PROFIT:.1%}")
-    print(f"Min Confidence: {config.MIN_SIGNAL_CONFIDENCE:.1%}")
-    print(f"Trading Hours: {config.TRADING_START_TIME} - {config.TRADING_END_TIME}")
-    print(f"Watchlist: {len(StockLists.PERSONAL_WATCHLIST)} stocks")
-
-    print("\n🤖 CONSOLIDATED AUTOMATED SYSTEM CONFIGURATION")
-    print("=" * 50)
+    # Build the whole report first and emit it with a single write
+    parts = [
+        f"{_CONFIG_ICON}COMPLETE PERSONAL TRADING CONFIGURATION",
+        "=" * 70,
+        f"{_OK} NO DEPENDENCIES - COMPLETE STANDALONE CONFIG",
+        f"{_OK} NO INHERITANCE - ALL PARAMETERS SELF-CONTAINED",
+        f"{_OK} SINGLE SOURCE OF TRUTH FOR ENTIRE SYSTEM",
+        f"{_OK} ALL MISSING METHODS INCLUDED",
+        "=" * 70,
+        f"Short Selling: {_BAD + ' BLOCKED' if not config.ALLOW_SHORT_SELLING else _OK + ' Enabled'}",
+        f"Day Trading: {_BAD + ' BLOCKED' if not config.ALLOW_DAY_TRADING else _OK + ' Enabled'}",
+        f"Max Position: {config.MAX_POSITION_VALUE_PERCENT:.1%} of account",
+        f"Min Position: ${config.MIN_POSITION_VALUE}",
+        f"Max Positions: {config.MAX_POSITIONS_TOTAL}",
+        f"Stop Loss: {config.PERSONAL_STOP_LOSS:.1%}",
+        f"Take Profit: {config.PERSONAL_TAKE_PROFIT:.1%}",
+        f"Min Confidence: {config.MIN_SIGNAL_CONFIDENCE:.1%}",
+        f"Trading Hours: {config.TRADING_START_TIME} - {config.TRADING_END_TIME}",
+        f"Watchlist: {len(StockLists.PERSONAL_WATCHLIST)} stocks",
+        f"\n{_SYSTEM_ICON}CONSOLIDATED AUTOMATED SYSTEM CONFIGURATION",
+        "=" * 50,
+    ]
 
     # Get current automated system settings
     summary = config.get_automated_system_summary()
 
-    print(f"Strategy Mode: {summary['mode']}")
-    print(f"Strategy Override: {summary['strategy_override']}")
-    print(f"Stock List Override: {summary['stock_list_override']}")
-    print(f"Ignore Market Conditions: {summary['ignore_market_conditions']}")
-    print(f"Enable Retry: {summary['enable_retry']}")
-    print(f"Fallback Strategy: {summary['fallback_strategy']}")
-    print(f"Max Attempts: {summary['max_attempts']}")
+    parts.extend([
+        f"Strategy Mode: {summary['mode']}",
+        f"Strategy Override: {summary['strategy_override']}",
+        f"Stock List Override: {summary['stock_list_override']}",
+        f"Ignore Market Conditions: {summary['ignore_market_conditions']}",
+        f"Enable Retry: {summary['enable_retry']}",
+        f"Fallback Strategy: {summary['fallback_strategy']}",
+        f"Max Attempts: {summary['max_attempts']}",
+    ])
 
     # Test missing methods
-    print("\n🔧 TESTING MISSING METHODS")
-    print("=" * 40)
+    parts.append(f"\n{_CONFIG_ICON}TESTING MISSING METHODS")
+    parts.append("=" * 40)
 
     try:
         stock_list = config.get_stock_list_for_data_fetch()
-        print(f"✅ get_stock_list_for_data_fetch(): {len(stock_list)} stocks")
+        parts.append(f"{_OK} get_stock_list_for_data_fetch(): {len(stock_list)} stocks")
     except Exception as e:
-        print(f"❌ get_stock_list_for_data_fetch(): {e}")
+        parts.append(f"{_BAD} get_stock_list_for_data_fetch(): {e}")
 
     try:
         strategy_override = config.get_recommended_strategy_override()
-        print(f"✅ get_recommended_strategy_override(): {strategy_override}")
+        parts.append(f"{_OK} get_recommended_strategy_override(): {strategy_override}")
     except Exception as e:
-        print(f"❌ get_recommended_strategy_override(): {e}")
+        parts.append(f"{_BAD} get_recommended_strategy_override(): {e}")
 
     # Show full config summary
-    print("\n📋 COMPLETE CONFIGURATION SUMMARY")
-    print("=" * 50)
+    parts.append(f"\n{_SUMMARY_ICON}COMPLETE CONFIGURATION SUMMARY")
+    parts.append("=" * 50)
     full_config = config.get_all_config_summary()
     for section, values in full_config.items():
-        print(f"\n{section.upper()}:")
-        for key, value in values.items():
-            print(f"  {key}: {value}")
-
-    print("\n" + "="*70)
-    print("✅ COMPLETE CONFIG VALIDATION SUCCESSFUL")
-    print("✅ ALL MISSING METHODS IMPLEMENTED")
-    print("✅ READY FOR MAIN.PY INTEGRATION")
-    print("="*70)
+        parts.append(f"\n{section.upper()}:")
+        parts.extend(f"  {key}: {value}" for key, value in values.items())
+
+    parts.extend([
+        "\n" + "="*70,
+        f"{_OK} COMPLETE CONFIG VALIDATION SUCCESSFUL",
+        f"{_OK} ALL MISSING METHODS IMPLEMENTED",
+        f"{_OK} READY FOR MAIN.PY INTEGRATION",
+        "="*70,
+    ])
+
+    sys.stdout.write('\n'.join(parts) + '\n')
 
 
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
 # Accounts module for managing trading accounts
 
 
-from .account_info import AccountInfo
+from .account_info import AccountInfo, Position, PositionArrays
 from .account_manager import AccountManager
 
-__all__ = ['AccountInfo', 'AccountManager']
\ No newline at end of file
+__all__ = ['AccountInfo', 'AccountManager', 'Position', 'PositionArrays']
\ No newline at end of file
@@ -1,10 +1,69 @@
 # accounts/account_info.py
-from dataclasses import dataclass
-from typing import List, Dict
+import sys
+import numpy as np
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import List, Dict, Optional
 
-@dataclass
+# Webull reports account types under both display and short names
+_CASH_TYPES = frozenset({'Cash Account', 'CASH'})
+_MARGIN_TYPES = frozenset({'Margin Account', 'MRGN'})
+
+@dataclass(slots=True)
+class Position:
+    """A single open position in an account"""
+    symbol: str
+    quantity: float
+    cost_price: float
+    current_price: float
+    market_value: float
+    unrealized_pnl: float
+    pnl_rate: float
+    last_open_time: str
+
+@dataclass(frozen=True, slots=True)
+class PositionArrays:
+    """Column-oriented (structure-of-arrays) view of an account's positions"""
+    NUMERIC_FIELDS = ('quantity', 'cost_price', 'current_price', 'market_value',
+                      'unrealized_pnl', 'pnl_rate')
+    
+    symbols: List[str]
+    quantity: np.ndarray
+    cost_price: np.ndarray
+    current_price: np.ndarray
+    market_value: np.ndarray
+    unrealized_pnl: np.ndarray
+    pnl_rate: np.ndarray
+    last_open_times: List[str]
+    
+    @classmethod
+    def from_positions(cls, positions: List[Position]) -> 'PositionArrays':
+        """Build the columns from positions in a single pass"""
+        numeric = attrgetter(*cls.NUMERIC_FIELDS)
+        values = np.array([numeric(pos) for pos in positions], dtype=np.float64)
+        columns = np.ascontiguousarray(values.reshape(-1, len(cls.NUMERIC_FIELDS)).T)
+        return cls(
+            [pos.symbol for pos in positions],
+            *columns,
+            [pos.last_open_time for pos in positions]
+        )
+    
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+@dataclass(slots=True)
 class AccountInfo:
     """Data class for account information"""
+    # ACCOUNT_CONFIGURATIONS keys for the account types AccountManager produces
+    _CONFIG_KEY_MAP = {
+        'Cash Account': 'CASH',
+        'Margin Account': 'MARGIN',
+        'IRA Account': 'IRA',
+        'Roth IRA Account': 'ROTH IRA',
+        'CASH': 'CASH',
+        'MRGN': 'MRGN',
+    }
+    
     account_id: str
     account_type: str  # 'CASH', 'MARGIN', 'IRA', etc.
     status: str        # 'active', 'unopen', etc.
@@ -14,17 +73,38 @@ class AccountInfo:
     zone: str
     net_liquidation: float = 0.0
     settled_funds: float = 0.0
-    positions: List[Dict] = None
+    positions: List[Position] = None
     day_trades_used: int = 0
     last_day_trade_reset: str = None
+    day_trades_remaining: Optional[int] = None  # Set by AccountManager from remainTradeTimes
+    pdt_status: bool = False
+    # Column view of self.positions, set by AccountManager on load
+    positions_soa: Optional[PositionArrays] = field(default=None, repr=False, compare=False)
+    # ACCOUNT_CONFIGURATIONS key and the config entry resolved for it
+    _config_key: str = field(default='', init=False, repr=False, compare=False)
+    _config_source: object = field(default=None, init=False, repr=False, compare=False)
+    _account_config: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.positions is None:
             self.positions = []
+        # Small fixed vocabularies; interning lets equality checks short-circuit on identity.
+        # Webull may omit any of them, so only strings are interned
+        if isinstance(self.account_type, str):
+            self.account_type = sys.intern(self.account_type)
+            self._config_key = (self._CONFIG_KEY_MAP.get(self.account_type)
+                                or self.account_type.upper().replace(' ACCOUNT', ''))
+        if isinstance(self.status, str):
+            self.status = sys.intern(self.status)
+        if isinstance(self.zone, str):
+            self.zone = sys.intern(self.zone)
     
     def get_allocation_info(self, config) -> Dict:
         """Get detailed account allocation information"""
-        total_position_value = sum(pos.get('market_value', 0) for pos in self.positions)
+        if self.positions_soa is not None and len(self.positions_soa) == len(self.positions):
+            total_position_value = float(self.positions_soa.market_value.sum())
+        else:
+            total_position_value = sum(pos.market_value for pos in self.positions)
         cash_percentage = (self.settled_funds / self.net_liquidation * 100) if self.net_liquidation > 0 else 0
         positions_percentage = (total_position_value / self.net_liquidation * 100) if self.net_liquidation > 0 else 0
         
@@ -48,38 +128,40 @@ class AccountInfo:
     
     def is_enabled_for_trading(self, config) -> bool:
         """Check if this account is enabled for trading based on config"""
-        config_key = self.account_type.upper().replace(' ACCOUNT', '')
-        account_config = config.ACCOUNT_CONFIGURATIONS.get(config_key, {})
-        return account_config.get('enabled', False)
+        return self.get_account_config(config).get('enabled', False)
     
     def get_account_config(self, config) -> Dict:
-        """Get the configuration for this account type"""
-        config_key = self.account_type.upper().replace(' ACCOUNT', '')
-        return config.ACCOUNT_CONFIGURATIONS.get(config_key, {})
+        """Get the configuration for this account type (cached per config object)"""
+        if self._config_source is not config:
+            self._account_config = config.ACCOUNT_CONFIGURATIONS.get(self._config_key, {})
+            self._config_source = config
+        return self._account_config
+    
+    def clear_config_cache(self):
+        """Drop the cached account configuration so it is re-read on next use"""
+        self._config_source = None
+        self._account_config = None
     
     def can_day_trade(self, config) -> bool:
-            """Check if this account can perform day trading"""
-            account_config = self.get_account_config(config)
-            if not account_config.get('day_trading_enabled', False):
-                return False
-            
-            # Cash accounts can always day trade (using settled funds)
-            if self.account_type in ['Cash Account', 'CASH']:
-                return True
-            
-            # For margin accounts, check day trades remaining first
-            if hasattr(self, 'day_trades_remaining') and self.day_trades_remaining is not None:
-                if self.day_trades_remaining >= 1:
-                    return True
-                else:
-                    return False  # No day trades remaining
-            
-            # Fallback to PDT protection requirements (for accounts >= $25K)
-            if account_config.get('pdt_protection', False):
-                min_value = account_config.get('min_account_value_for_pdt', 25000)
-                return self.net_liquidation >= min_value
-            
-            return False  # Default to false for margin accounts without day trade data
+        """Check if this account can perform day trading"""
+        account_config = self.get_account_config(config)
+        if not account_config.get('day_trading_enabled', False):
+            return False
+        
+        # Cash accounts can always day trade (using settled funds)
+        if self.account_type in _CASH_TYPES:
+            return True
+        
+        # For margin accounts, check day trades remaining first
+        if self.day_trades_remaining is not None:
+            return self.day_trades_remaining >= 1  # False when no day trades remaining
+        
+        # Fallback to PDT protection requirements (for accounts >= $25K)
+        if account_config.get('pdt_protection', False):
+            min_value = account_config.get('min_account_value_for_pdt', 25000)
+            return self.net_liquidation >= min_value
+        
+        return False  # Default to false for margin accounts without day trade data
     
     def get_position_limits(self, config) -> Dict:
         """Get position limits for this account"""
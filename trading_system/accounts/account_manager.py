@@ -1,8 +1,29 @@
 # accounts/account_manager.py
+import copy
 import logging
-from datetime import datetime
+import operator
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from typing import Dict, List, Optional
-from .account_info import AccountInfo
+from .account_info import AccountInfo, Position, PositionArrays, _CASH_TYPES, _MARGIN_TYPES
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Zone field names seen in Webull account payloads, in priority order
+_ZONE_FIELDS = ('rzone', 'zone', 'zoneVar', 'zone_var')
+
+# accountMembers fields tried for available funds when no balance field is set, in priority order
+_FALLBACK_FUNDS_FIELDS = ('dayBuyingPower', 'availableFunds', 'buyingPower')
+
+# Numeric position fields, in Position field order (quantity .. pnl_rate)
+_POSITION_NUMERIC_FIELDS = operator.itemgetter(
+    'position', 'costPrice', 'lastPrice', 'marketValue',
+    'unrealizedProfitLoss', 'unrealizedProfitLossRate')
 
 class AccountManager:
     """Account Manager - Fully integrated with PersonalTradingConfig"""
@@ -48,9 +69,10 @@ class AccountManager:
             # Get all account IDs using proper API
             headers = self.wb.build_req_headers()
             response = self.wb._session.get(self.wb._urls.account_id(), headers=headers, timeout=self.wb.timeout)
-            result = response.json()
+            result = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
             
-            self.logger.debug(f"Account discovery API response keys: {list(result.keys())}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Account discovery API response keys: %s", list(result.keys()))
             
             if not result.get('success') or not result.get('data'):
                 self.logger.error("❌ Failed to retrieve account list from Webull API")
@@ -62,24 +84,25 @@ class AccountManager:
             
             # Process each account automatically
             active_accounts = 0
+            new_accounts = []
             for i, account_info in enumerate(accounts_data):
-                self.logger.debug(f"Processing account {i+1}: {account_info.get('secAccountId', 'Unknown ID')}")
+                self.logger.debug("Processing account %s: %s", i+1, account_info.get('secAccountId', 'Unknown ID'))
                 
                 account_id = account_info.get('secAccountId')
                 status = account_info.get('status', 'Unknown')
-                rzone = account_info.get('rzone', 'dc_core_r001')  # Provide default
+                rzone = next((account_info[f] for f in _ZONE_FIELDS if f in account_info), 'dc_core_r001')  # Provide default
                 
-                self.logger.debug(f"   Account ID: {account_id}")
-                self.logger.debug(f"   Status: {status}")
-                self.logger.debug(f"   RZone: {rzone}")
+                self.logger.debug("   Account ID: %s", account_id)
+                self.logger.debug("   Status: %s", status)
+                self.logger.debug("   RZone: %s", rzone)
                 
                 if status != 'active' or not account_id:
-                    self.logger.debug(f"⏭️ Skipping {status} account: {account_info.get('brokerName', 'Unknown')}")
+                    self.logger.debug("⏭️ Skipping %s account: %s", status, account_info.get('brokerName', 'Unknown'))
                     continue
                 
                 # Determine account type
                 account_type = self._determine_account_type(account_info)
-                self.logger.debug(f"   Determined account type: {account_type}")
+                self.logger.debug("   Determined account type: %s", account_type)
                 
                 # Create AccountInfo object
                 account = AccountInfo(
@@ -93,13 +116,20 @@ class AccountManager:
                 )
                 
                 self.accounts[str(account_id)] = account
+                new_accounts.append(account)
                 active_accounts += 1
-                
-                # Load detailed account info
-                if self._load_account_details(account):
-                    self.logger.debug(f"✅ {account_type} Account loaded: ${account.net_liquidation:.2f}")
+            
+            # Load detailed account info
+            if getattr(self.config, 'PARALLEL_ACCOUNT_LOAD', False) and len(new_accounts) > 1:
+                loaded = self._load_account_details_parallel(new_accounts)
+            else:
+                loaded = [self._load_account_details(account) for account in new_accounts]
+            
+            for account, account_loaded in zip(new_accounts, loaded):
+                if account_loaded:
+                    self.logger.debug("✅ %s Account loaded: $%.2f", account.account_type, account.net_liquidation)
                 else:
-                    self.logger.warning(f"⚠️ Could not load details for {account_type} account")
+                    self.logger.warning(f"⚠️ Could not load details for {account.account_type} account")
             
             if not self.accounts:
                 self.logger.error("❌ No active accounts found")
@@ -110,7 +140,7 @@ class AccountManager:
             
         except Exception as e:
             self.logger.error(f"❌ Error discovering accounts: {str(e)}")
-            self.logger.debug(f"Full exception details:", exc_info=True)
+            self.logger.debug("Full exception details:", exc_info=True)
             return False
     
     def _determine_account_type(self, account_info: Dict) -> str:
@@ -130,152 +160,185 @@ class AccountManager:
         self.logger.debug(f"   Account type from brokerName: {broker_name} -> {mapped_type}")
         return mapped_type
     
-    def _load_account_details(self, account: AccountInfo) -> bool:
+    def _load_account_details_parallel(self, accounts: List[AccountInfo]) -> List[bool]:
+        """Load several accounts concurrently, each through its own client copy"""
+        clients = [self._worker_client() for _ in accounts]
+        try:
+            with ThreadPoolExecutor(max_workers=len(accounts)) as executor:
+                futures = [
+                    executor.submit(self._load_account_details, account, wb)
+                    for account, wb in zip(accounts, clients)
+                ]
+                return [future.result() for future in futures]
+        finally:
+            for wb in clients:
+                wb._session.close()
+    
+    def _worker_client(self):
+        """Shallow copy of the Webull client that is safe to use alongside the original"""
+        # build_req_headers writes reqid/access_token/lzone into _headers in place, so each
+        # copy needs its own headers dict (and session) or threads race on the account zone
+        wb = copy.copy(self.wb)
+        wb._headers = dict(self.wb._headers)
+        wb._session = requests.Session()
+        wb._session.headers.update(self.wb._session.headers)
+        wb._session.cookies.update(self.wb._session.cookies)
+        return wb
+    
+    def _load_account_details(self, account: AccountInfo, wb=None) -> bool:
         """Load detailed information for a specific account"""
         try:
-            self.logger.debug(f"Loading details for account {account.account_id} ({account.account_type})")
+            self.logger.debug("Loading details for account %s (%s)", account.account_id, account.account_type)
             
             # Switch to this account
-            self.wb._account_id = account.account_id
-            self.wb.zone_var = account.zone
+            wb = wb or self.wb
+            wb._account_id = account.account_id
+            wb.zone_var = account.zone
             
-            self.logger.debug(f"   Set wb._account_id to: {self.wb._account_id}")
-            self.logger.debug(f"   Set wb.zone_var to: {self.wb.zone_var}")
+            self.logger.debug("   Set wb._account_id to: %s", wb._account_id)
+            self.logger.debug("   Set wb.zone_var to: %s", wb.zone_var)
             
             # Get account details
-            account_data = self.wb.get_account()
+            account_data = wb.get_account()
             
             if not account_data:
                 self.logger.warning(f"⚠️ No account data returned for {account.account_id}")
                 return False
             
-            self.logger.debug(f"   Account data keys: {list(account_data.keys()) if isinstance(account_data, dict) else type(account_data)}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("   Account data keys: %s",
+                                  list(account_data.keys()) if isinstance(account_data, dict) else type(account_data))
+            
+            # Newer payloads carry some balance fields at top level; each field is looked up
+            # there first and accountMembers is only flattened (once) when one is missing
+            members = None
+            
+            def field(key):
+                nonlocal members
+                if key in account_data:
+                    return account_data[key]
+                if members is None:
+                    members = self._flatten_members(account_data)
+                return members.get(key)
             
             # Extract net liquidation from TOP-LEVEL first
             if 'netLiquidation' in account_data:
                 account.net_liquidation = float(account_data['netLiquidation'])
-                self.logger.debug(f"💰 Found top-level netLiquidation: ${account.net_liquidation:.2f}")
-            else:
+                self.logger.debug("💰 Found top-level netLiquidation: $%.2f", account.net_liquidation)
+            elif (value := field('netLiquidation')) is not None:
                 # Fallback to accountMembers
-                for member in account_data.get('accountMembers', []):
-                    key = member.get('key', '')
-                    value = member.get('value', '')
-                    
-                    if key == 'netLiquidation':
-                        account.net_liquidation = float(value)
-                        self.logger.debug(f"💰 Found netLiquidation in accountMembers: ${account.net_liquidation:.2f}")
-                        break
-                    elif key == 'totalMarketValue':
-                        account.net_liquidation = float(value)
-                        self.logger.debug(f"💰 Using totalMarketValue as netLiquidation: ${account.net_liquidation:.2f}")
-                        break
+                account.net_liquidation = float(value)
+                self.logger.debug("💰 Found netLiquidation in accountMembers: $%.2f", account.net_liquidation)
+            elif (value := field('totalMarketValue')) is not None:
+                account.net_liquidation = float(value)
+                self.logger.debug("💰 Using totalMarketValue as netLiquidation: $%.2f", account.net_liquidation)
             
             # Extract available funds based on account type
             account.settled_funds = 0.0
             
-            for member in account_data.get('accountMembers', []):
-                key = member.get('key', '')
-                value = member.get('value', '')
-                
-                # For cash accounts, use settledFunds
-                if key == 'settledFunds' and account.account_type in ['Cash Account', 'CASH']:
-                    account.settled_funds = float(value)
-                    self.logger.debug(f"💵 Found settledFunds (cash): ${account.settled_funds:.2f}")
-                    break
-                
-                # For margin accounts, use cashBalance
-                elif key == 'cashBalance' and account.account_type in ['Margin Account', 'MRGN']:
-                    account.settled_funds = float(value)
-                    self.logger.debug(f"💵 Found cashBalance (margin): ${account.settled_funds:.2f}")
-                    break
-                
-                # Fallback: use cashBalance for any account if settledFunds not found
-                elif key == 'cashBalance' and account.settled_funds == 0:
-                    account.settled_funds = float(value)
-                    self.logger.debug(f"💵 Using cashBalance as fallback: ${account.settled_funds:.2f}")
+            # For cash accounts, use settledFunds
+            if account.account_type in _CASH_TYPES and (value := field('settledFunds')) is not None:
+                account.settled_funds = float(value)
+                self.logger.debug("💵 Found settledFunds (cash): $%.2f", account.settled_funds)
+            
+            # For margin accounts, use cashBalance
+            elif account.account_type in _MARGIN_TYPES and (value := field('cashBalance')) is not None:
+                account.settled_funds = float(value)
+                self.logger.debug("💵 Found cashBalance (margin): $%.2f", account.settled_funds)
+            
+            # Fallback: use cashBalance for any account if settledFunds not found
+            elif (value := field('cashBalance')) is not None:
+                account.settled_funds = float(value)
+                self.logger.debug("💵 Using cashBalance as fallback: $%.2f", account.settled_funds)
             
             # If still no funds found, try alternative fields
             if account.settled_funds == 0:
-                for member in account_data.get('accountMembers', []):
-                    key = member.get('key', '')
-                    value = member.get('value', '')
-                    
-                    if key in ['dayBuyingPower', 'availableFunds', 'buyingPower']:
+                if members is None:
+                    members = self._flatten_members(account_data)
+                for key in _FALLBACK_FUNDS_FIELDS:
+                    if (value := members.get(key)) is not None:
                         account.settled_funds = float(value)
-                        self.logger.debug(f"💵 Using {key} as funds: ${account.settled_funds:.2f}")
+                        self.logger.debug("💵 Using %s as funds: $%.2f", key, account.settled_funds)
                         break
             
             # Extract positions
             account.positions = []
             for position in account_data.get('positions', []):
-                pos_data = {
-                    'symbol': position['ticker']['symbol'],
-                    'quantity': float(position['position']),
-                    'cost_price': float(position['costPrice']),
-                    'current_price': float(position['lastPrice']),
-                    'market_value': float(position['marketValue']),
-                    'unrealized_pnl': float(position['unrealizedProfitLoss']),
-                    'pnl_rate': float(position['unrealizedProfitLossRate']),
-                    'last_open_time': position['lastOpenTime']
-                }
+                pos_data = Position(
+                    position['ticker']['symbol'],
+                    *map(float, _POSITION_NUMERIC_FIELDS(position)),
+                    last_open_time=position['lastOpenTime']
+                )
                 account.positions.append(pos_data)
+            account.positions_soa = PositionArrays.from_positions(account.positions)
             
             # Load day trading information
-            self._load_day_trading_info(account, account_data)
+            self._load_day_trading_info(account, account_data, members)
 
 
 
             
             # Log final values
-            self.logger.debug(f"📊 Final values for {account.account_type}:")
-            self.logger.debug(f"   Net Liquidation: ${account.net_liquidation:.2f}")
-            self.logger.debug(f"   Available Funds: ${account.settled_funds:.2f}")
-            self.logger.debug(f"   Positions: {len(account.positions)}")
+            self.logger.debug("📊 Final values for %s:", account.account_type)
+            self.logger.debug("   Net Liquidation: $%.2f", account.net_liquidation)
+            self.logger.debug("   Available Funds: $%.2f", account.settled_funds)
+            self.logger.debug("   Positions: %s", len(account.positions))
             
             return True
             
         except Exception as e:
             self.logger.error(f"❌ Error loading account details for {account.account_id}: {str(e)}")
-            self.logger.debug(f"Full exception details:", exc_info=True)
+            self.logger.debug("Full exception details:", exc_info=True)
             return False
 
-    def _load_day_trading_info(self, account: AccountInfo, account_data: Dict):
+    @staticmethod
+    def _flatten_members(account_data: Dict) -> Dict:
+        """Map accountMembers [{'key': k, 'value': v}, ...] to {k: v}"""
+        return {
+            member.get('key', ''): member.get('value', '')
+            for member in account_data.get('accountMembers', [])
+        }
+
+    def _load_day_trading_info(self, account: AccountInfo, account_data: Dict,
+                               members: Optional[Dict] = None):
         """Load day trading information for PDT tracking"""
         try:
             # Extract PDT status from top level
             account.pdt_status = account_data.get('pdt', False)
             
-            # Extract day trades remaining from accountMembers
+            # Extract day trades remaining (top level first, then accountMembers)
             account.day_trades_remaining = None
             
-            for member in account_data.get('accountMembers', []):
-                key = member.get('key', '')
-                value = member.get('value', '')
-                
-                if key == 'remainTradeTimes':
-                    # Parse the remainTradeTimes string (e.g., "2,2,2,2,2")
-                    try:
-                        if isinstance(value, str) and value:
-                            if value.lower() == 'unlimited':
-                                # Cash accounts often show "Unlimited"
-                                account.day_trades_remaining = 999
-                                self.logger.debug(f"   Day trades remaining: Unlimited (set to 999)")
-                            else:
-                                # Split by comma and get the minimum (most restrictive day)
-                                day_trades_list = [int(x.strip()) for x in value.split(',') if x.strip().isdigit()]
-                                if day_trades_list:
-                                    account.day_trades_remaining = min(day_trades_list)
-                                    self.logger.debug(f"   Day trades remaining: {account.day_trades_remaining} (from {value})")
-                                else:
-                                    self.logger.warning(f"   Could not parse remainTradeTimes: {value}")
-                        elif isinstance(value, (int, float)):
-                            account.day_trades_remaining = int(value)
-                    except Exception as e:
-                        self.logger.warning(f"   Error parsing remainTradeTimes '{value}': {e}")
-                        
+            if 'remainTradeTimes' in account_data:
+                value = account_data['remainTradeTimes']
+            else:
+                if members is None:
+                    members = self._flatten_members(account_data)
+                value = members.get('remainTradeTimes')
+            
+            if value is not None:
+                # Parse the remainTradeTimes string (e.g., "2,2,2,2,2")
+                try:
+                    if isinstance(value, str) and value:
+                        if value.lower() == 'unlimited':
+                            # Cash accounts often show "Unlimited"
+                            account.day_trades_remaining = 999
+                            self.logger.debug("   Day trades remaining: Unlimited (set to 999)")
+                        else:
+                            # Split by comma and get the minimum (most restrictive day)
+                            try:
+                                account.day_trades_remaining = min(map(int, value.split(',')))
+                                self.logger.debug("   Day trades remaining: %s (from %s)", account.day_trades_remaining, value)
+                            except ValueError:
+                                self.logger.warning(f"   Could not parse remainTradeTimes: {value}")
+                    elif isinstance(value, (int, float)):
+                        account.day_trades_remaining = int(value)
+                except Exception as e:
+                    self.logger.warning(f"   Error parsing remainTradeTimes '{value}': {e}")
+                    
             # Set defaults if not found
             if account.day_trades_remaining is None:
-                if account.account_type in ['Cash Account', 'CASH']:
+                if account.account_type in _CASH_TYPES:
                     # Cash accounts don't have day trade limits
                     account.day_trades_remaining = 999  # Unlimited for cash
                 elif account.pdt_status:
@@ -286,30 +349,33 @@ class AccountManager:
                     account.day_trades_remaining = 0
                     
             account.day_trades_used = 0  # Reset daily (would need to track this)
-            account.last_day_trade_reset = datetime.now().strftime('%Y-%m-%d')
+            account.last_day_trade_reset = date.today().isoformat()
             
-            self.logger.debug(f"📊 Day Trading Info for {account.account_type}:")
-            self.logger.debug(f"   PDT Status: {account.pdt_status}")
-            self.logger.debug(f"   Day Trades Remaining: {account.day_trades_remaining}")
+            self.logger.debug("📊 Day Trading Info for %s:", account.account_type)
+            self.logger.debug("   PDT Status: %s", account.pdt_status)
+            self.logger.debug("   Day Trades Remaining: %s", account.day_trades_remaining)
             
         except Exception as e:
             self.logger.warning(f"⚠️ Could not load day trading info for {account.account_id}: {e}")
             # Set safe defaults
-            account.day_trades_remaining = 0 if account.account_type not in ['Cash Account', 'CASH'] else 999
+            account.day_trades_remaining = 0 if account.account_type not in _CASH_TYPES else 999
             account.pdt_status = False
             account.day_trades_used = 0
-            account.last_day_trade_reset = datetime.now().strftime('%Y-%m-%d')
+            account.last_day_trade_reset = date.today().isoformat()
     
     def get_enabled_accounts(self) -> List[AccountInfo]:
         """Get list of accounts enabled for trading based on PersonalTradingConfig"""
         enabled_accounts = []
+        debug = self.logger.isEnabledFor(logging.DEBUG)
         
         for account in self.accounts.values():
             if account.is_enabled_for_trading(self.config):
                 enabled_accounts.append(account)
-                self.logger.debug(f"✅ Account enabled for trading: {account.account_type} (${account.settled_funds:.2f})")
-            else:
-                self.logger.debug(f"❌ Account disabled: {account.account_type}")
+                if debug:
+                    self.logger.debug("✅ Account enabled for trading: %s ($%.2f)",
+                                      account.account_type, account.settled_funds)
+            elif debug:
+                self.logger.debug("❌ Account disabled: %s", account.account_type)
         
         return enabled_accounts
     
@@ -337,20 +403,24 @@ class AccountManager:
         """Get summary of all accounts using PersonalTradingConfig"""
         summary = {
             'total_accounts': len(self.accounts),
-            'enabled_accounts': len(self.get_enabled_accounts()),
+            'enabled_accounts': 0,
             'total_value': 0.0,
             'total_cash': 0.0,
             'total_positions': 0,
             'accounts': []
         }
         
+        enabled_count = 0
         for account in self.accounts.values():
+            # One config lookup per account; 'enabled' is derived from it directly
             account_config = account.get_account_config(self.config)
+            enabled = account_config.get('enabled', False)
+            enabled_count += bool(enabled)
             
             account_summary = {
                 'account_id': account.account_id,
                 'account_type': account.account_type,
-                'enabled': account.is_enabled_for_trading(self.config),
+                'enabled': enabled,
                 'net_liquidation': account.net_liquidation,
                 'settled_funds': account.settled_funds,
                 'positions_count': len(account.positions),
@@ -364,10 +434,12 @@ class AccountManager:
             summary['total_cash'] += account.settled_funds
             summary['total_positions'] += len(account.positions)
         
+        summary['enabled_accounts'] = enabled_count
         return summary
     
     def refresh_account_details(self, account: AccountInfo) -> bool:
         """Refresh account details after a trade or other change"""
+        account.clear_config_cache()
         return self._load_account_details(account)
     
     def get_account_by_id(self, account_id: str) -> Optional[AccountInfo]:
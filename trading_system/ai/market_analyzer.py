@@ -1,10 +1,146 @@
 # ai/market_analyzer.py
+import weakref
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from itertools import product
+from types import MappingProxyType
 from typing import Dict, Tuple, List
-from sklearn.preprocessing import StandardScaler
-from sklearn.ensemble import RandomForestClassifier
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Rolling window used for the gap-day volume average (matches TechnicalIndicators.gap_volume_ratio)
+_GAP_VOLUME_WINDOW = 20
+
+# Column layout of the stacked bar array used by detect_gap_environment
+_OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+_OPEN, _HIGH, _LOW, _CLOSE, _VOLUME = range(len(_OHLCV_COLUMNS))
+
+# Gap environment score terms: gap frequency, significant gaps, high-volume gaps
+_GAP_SCORE_WEIGHTS = np.array([2.0, 0.1, 0.15])
+_GAP_SCORE_CAPS = np.array([0.4, 0.3, 0.3])
+
+# Market condition classification thresholds
+_HIGH_VOL = 0.25          # Annualized 20-day volatility
+_HIGH_VIX = 30
+_LOW_VOL = 0.15
+_LOW_VIX = 15
+_TREND_MOMENTUM = 0.05    # Absolute 20-day momentum
+_TREND_STRENGTH = 0.03    # Absolute distance from the 20-day SMA
+
+# Readings that raise confidence in the classification
+_EXTREME_VIX_HIGH = 35
+_EXTREME_VIX_LOW = 12
+_EXTREME_VOL_HIGH = 0.3
+_EXTREME_VOL_LOW = 0.1
+_STRONG_MOMENTUM = 0.08
+
+_STRATEGY_MAP = MappingProxyType({
+    'RANGE_BOUND': 'BollingerMeanReversion',
+    'HIGH_VOLATILITY': 'IronCondor',
+    'LOW_VOLATILITY': 'CoveredCall',
+    'TRENDING': 'Momentum'
+})
+
+# Volatility / VIX bands for the condition rule table
+_BAND_LOW, _BAND_MID, _BAND_HIGH = 0, 1, 2
+
+def _band(value: float, low: float, high: float) -> int:
+    """Place value below low, between low and high (inclusive, or NaN), or above high"""
+    if value < low:
+        return _BAND_LOW
+    if value > high:
+        return _BAND_HIGH
+    return _BAND_MID
+
+def _condition_rule(vol_band: int, vix_band: int, strong_momentum: bool, strong_trend: bool) -> str:
+    """Market condition decision rules, expressed on banded features"""
+    # High volatility condition
+    if vol_band == _BAND_HIGH or vix_band == _BAND_HIGH:
+        return 'HIGH_VOLATILITY'
+    
+    # Low volatility condition
+    if vol_band == _BAND_LOW and vix_band == _BAND_LOW:
+        return 'LOW_VOLATILITY'
+    
+    # Trending condition
+    if strong_momentum and strong_trend:
+        return 'TRENDING'
+    
+    # Range-bound condition (default for 2025 market)
+    return 'RANGE_BOUND'
+
+# Every (vol band, VIX band, momentum flag, trend flag) combination resolved once at import
+_CONDITION_RULES = MappingProxyType({
+    key: _condition_rule(*key)
+    for key in product(range(3), range(3), (False, True), (False, True))
+})
+
+def _market_features_kernel(close, high, low, volume):
+    """
+    Single pass over the last 50 bars producing the scalar SPY features
+    
+    Returns:
+        (sma_20, sma_50, volatility_20d, range_position, momentum_5d, momentum_20d, volume_ratio)
+    """
+    n = close.shape[0]
+    last = float(close[n - 1])
+    
+    sum_20 = 0.0
+    sum_50 = 0.0
+    high_20d = -np.inf
+    low_20d = np.inf
+    vol_sum_20 = 0.0
+    vol_count_20 = 0
+    vol_sum_5 = 0.0
+    vol_count_5 = 0
+    ret_mean = 0.0
+    ret_m2 = 0.0
+    ret_count = 0
+    # Inputs may be float32; every accumulator is float64
+    for i in range(n - 50, n):
+        price = float(close[i])
+        sum_50 += price
+        if i < n - 20:
+            continue
+        sum_20 += price
+        
+        # Welford update for the daily return ending at bar i
+        prev_price = float(close[i - 1])
+        r = (price - prev_price) / prev_price
+        ret_count += 1
+        delta = r - ret_mean
+        ret_mean += delta / ret_count
+        ret_m2 += delta * (r - ret_mean)
+        
+        # NaN-skipping window extremes and volume averages
+        if high[i] > high_20d:
+            high_20d = float(high[i])
+        if low[i] < low_20d:
+            low_20d = float(low[i])
+        bar_volume = float(volume[i])
+        if bar_volume == bar_volume:
+            vol_sum_20 += bar_volume
+            vol_count_20 += 1
+            if i >= n - 5:
+                vol_sum_5 += bar_volume
+                vol_count_5 += 1
+    
+    sma_20 = sum_20 / 20
+    sma_50 = sum_50 / 50
+    volatility_20d = np.sqrt(ret_m2 / (ret_count - 1)) * np.sqrt(252.0)  # Annualized
+    range_position = (last - low_20d) / (high_20d - low_20d)
+    momentum_5d = last / float(close[n - 6]) - 1.0
+    momentum_20d = last / float(close[n - 21]) - 1.0
+    volume_ratio = (vol_sum_5 / vol_count_5) / (vol_sum_20 / vol_count_20)
+    return sma_20, sma_50, volatility_20d, range_position, momentum_5d, momentum_20d, volume_ratio
+
+if NUMBA_AVAILABLE:
+    _market_features_kernel = njit(cache=True)(_market_features_kernel)
 
 class MarketConditionAnalyzer:
     """
@@ -20,6 +156,10 @@ class MarketConditionAnalyzer:
             'LOW_VOLATILITY': 'Use covered calls and income strategies',
             'HIGH_GAP_ENVIRONMENT': 'Use gap trading strategies'
         }
+        
+        # Trailing OHLCV bars per stock frame, keyed by id(frame); entries are dropped
+        # when their frame is garbage collected
+        self._bar_cache: Dict[int, Tuple[Tuple, np.ndarray]] = {}
     
     def analyze_market_condition(self, spy_data: pd.DataFrame, 
                                vix_data: pd.DataFrame = None) -> Dict:
@@ -33,7 +173,8 @@ class MarketConditionAnalyzer:
         Returns:
             Dictionary with market condition analysis
         """
-        if len(spy_data) < 50:
+        # Features need 50 bars; shape[0] works for DataFrames and raw arrays alike
+        if spy_data.shape[0] < 50:
             return self._default_condition()
         
         # Calculate market features
@@ -68,7 +209,8 @@ class MarketConditionAnalyzer:
             config: TradingConfig object
             
         Returns:
-            Dictionary with gap environment analysis
+            Dictionary with gap environment analysis; 'gap_stocks' is a DataFrame
+            with symbol, gap_size, gap_direction and quality columns
         """
         from indicators.technical import TechnicalIndicators
         
@@ -83,36 +225,44 @@ class MarketConditionAnalyzer:
             'gap_environment_score': 0
         }
         
-        total_gap_size = 0
-        gap_stocks = []
-        
-        for symbol, data in stock_data_dict.items():
-            if len(data) < 2:
-                continue
-                
-            gap_stats['total_stocks'] += 1
-            
-            # Calculate gap for latest day
-            gap_percent = TechnicalIndicators.detect_gaps(data).iloc[-1]
-            volume_ratio = TechnicalIndicators.gap_volume_ratio(data).iloc[-1]
-            
-            if abs(gap_percent) >= config.GAP_MIN_SIZE:
-                gap_stats['stocks_with_gaps'] += 1
-                total_gap_size += abs(gap_percent)
-                
-                gap_classification = TechnicalIndicators.classify_gap(gap_percent, volume_ratio)
-                gap_stocks.append({
-                    'symbol': symbol,
-                    'gap_size': abs(gap_percent),
-                    'gap_direction': gap_classification['direction'],
-                    'quality': gap_classification['quality']
-                })
-                
-                if abs(gap_percent) >= config.GAP_MIN_SIZE * 2:  # 2% or larger
-                    gap_stats['significant_gaps'] += 1
-                
-                if volume_ratio >= config.GAP_VOLUME_MULTIPLIER:
-                    gap_stats['high_volume_gaps'] += 1
+        # Stack the trailing bars of every symbol with at least two bars into one
+        # (symbols x bars x OHLCV) array; shorter histories are NaN-padded at the front
+        frames = [(symbol, data) for symbol, data in stock_data_dict.items() if len(data) >= 2]
+        n = len(frames)
+        symbols = [symbol for symbol, _ in frames]
+        bars = np.full((n, _GAP_VOLUME_WINDOW, len(_OHLCV_COLUMNS)), np.nan)
+        for i, (_, data) in enumerate(frames):
+            tail = self._trailing_bars(data)
+            bars[i, _GAP_VOLUME_WINDOW - len(tail):] = tail
+        
+        prev_close = bars[:, -2, _CLOSE]
+        today_open = bars[:, -1, _OPEN]
+        today_volume = bars[:, -1, _VOLUME]
+        avg_volume = bars[:, :, _VOLUME].mean(axis=1)  # NaN when fewer than 20 bars, as with rolling()
+        
+        # Same definitions as TechnicalIndicators.detect_gaps / gap_volume_ratio, latest bar only
+        with np.errstate(divide='ignore', invalid='ignore'):
+            gap_percent = (today_open - prev_close) / prev_close
+            volume_ratio = today_volume / avg_volume
+        gap_size = np.abs(gap_percent)
+        
+        has_gap = gap_size >= config.GAP_MIN_SIZE
+        gap_stats['total_stocks'] = n
+        gap_stats['stocks_with_gaps'] = int(has_gap.sum())
+        gap_stats['significant_gaps'] = int((gap_size >= config.GAP_MIN_SIZE * 2).sum())  # 2% or larger
+        gap_stats['high_volume_gaps'] = int((has_gap & (volume_ratio >= config.GAP_VOLUME_MULTIPLIER)).sum())
+        total_gap_size = gap_size[has_gap].sum()
+        
+        # One row per gapping symbol, built in a single allocation
+        gap_idx = np.flatnonzero(has_gap)
+        gap_direction, gap_quality = TechnicalIndicators.classify_gaps(gap_percent[gap_idx],
+                                                                      volume_ratio[gap_idx])
+        gap_stocks = pd.DataFrame({
+            'symbol': np.array(symbols, dtype=object)[gap_idx],
+            'gap_size': gap_size[gap_idx],
+            'gap_direction': gap_direction,
+            'quality': gap_quality
+        })
         
         # Calculate statistics
         if gap_stats['total_stocks'] > 0:
@@ -128,17 +278,32 @@ class MarketConditionAnalyzer:
             gap_stats['high_volume_gaps'] >= 2
         )
         
-        # Calculate gap environment score (0-1)
-        score = 0
-        score += min(gap_stats['gap_frequency'] * 2, 0.4)  # Max 0.4 for frequency
-        score += min(gap_stats['significant_gaps'] * 0.1, 0.3)  # Max 0.3 for significant gaps
-        score += min(gap_stats['high_volume_gaps'] * 0.15, 0.3)  # Max 0.3 for volume
-        gap_stats['gap_environment_score'] = min(score, 1.0)
+        # Calculate gap environment score (0-1): capped, weighted frequency / significant / volume terms
+        score_inputs = np.array([gap_stats['gap_frequency'],
+                                 gap_stats['significant_gaps'],
+                                 gap_stats['high_volume_gaps']], dtype=np.float64)
+        score = np.minimum(score_inputs * _GAP_SCORE_WEIGHTS, _GAP_SCORE_CAPS).sum()
+        gap_stats['gap_environment_score'] = float(min(score, 1.0))
         
         gap_stats['gap_stocks'] = gap_stocks
         
         return gap_stats
     
+    def _trailing_bars(self, data: pd.DataFrame) -> np.ndarray:
+        """Last bars of a stock frame as an OHLCV float64 array, reused while the frame is unchanged"""
+        key = id(data)
+        signature = (len(data), data.index[-1])
+        cached = self._bar_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        
+        # reindex rather than select so frames without High/Low still stack (as NaN)
+        tail = data.iloc[-_GAP_VOLUME_WINDOW:].reindex(columns=_OHLCV_COLUMNS).to_numpy(dtype=np.float64)
+        if cached is None:
+            weakref.finalize(data, self._bar_cache.pop, key, None)
+        self._bar_cache[key] = (signature, tail)
+        return tail
+    
     def analyze_market_with_gaps(self, spy_data: pd.DataFrame, 
                                stock_data_dict: Dict[str, pd.DataFrame],
                                config, vix_data: pd.DataFrame = None) -> Dict:
@@ -176,31 +341,43 @@ class MarketConditionAnalyzer:
     def _calculate_market_features(self, spy_data: pd.DataFrame, 
                                  vix_data: pd.DataFrame = None) -> Dict:
         """Calculate features for market condition analysis"""
-        close_prices = spy_data['Close']
+        # Only the last 50 bars are used; float32 storage is ample for these
+        # features, while reductions below accumulate in float64
+        close_arr = np.ascontiguousarray(spy_data['Close'].to_numpy()[-50:], dtype=np.float32)
+        high_arr = np.ascontiguousarray(spy_data['High'].to_numpy()[-50:], dtype=np.float32)
+        low_arr = np.ascontiguousarray(spy_data['Low'].to_numpy()[-50:], dtype=np.float32)
+        volume_arr = np.ascontiguousarray(spy_data['Volume'].to_numpy()[-50:], dtype=np.float32)
+        current_price = np.float64(close_arr[-1])
+        
+        if NUMBA_AVAILABLE:
+            (sma_20, sma_50, volatility_20d, range_position,
+             momentum_5d, momentum_20d, volume_ratio) = _market_features_kernel(
+                close_arr, high_arr, low_arr, volume_arr)
+        else:
+            # Trend features
+            sma_20 = close_arr[-20:].mean(dtype=np.float64)
+            sma_50 = close_arr[-50:].mean(dtype=np.float64)
         
-        # Trend features
-        sma_20 = close_prices.rolling(20).mean()
-        sma_50 = close_prices.rolling(50).mean()
-        trend_strength = (close_prices.iloc[-1] - sma_20.iloc[-1]) / sma_20.iloc[-1]
+            # Volatility features
+            recent_closes = close_arr[-21:].astype(np.float64)
+            returns = np.diff(recent_closes) / recent_closes[:-1]
+            volatility_20d = returns.std(ddof=1) * np.sqrt(252)  # Annualized
         
-        # Volatility features
-        returns = close_prices.pct_change().dropna()
-        volatility_20d = returns.tail(20).std() * np.sqrt(252)  # Annualized
+            # Range-bound detection
+            high_20d = np.float64(np.nanmax(high_arr[-20:]))
+            low_20d = np.float64(np.nanmin(low_arr[-20:]))
+            range_position = (current_price - low_20d) / (high_20d - low_20d)
         
-        # Range-bound detection
-        high_20d = spy_data['High'].tail(20).max()
-        low_20d = spy_data['Low'].tail(20).min()
-        current_price = close_prices.iloc[-1]
-        range_position = (current_price - low_20d) / (high_20d - low_20d)
+            # Momentum features
+            momentum_5d = current_price / close_arr[-6] - 1
+            momentum_20d = current_price / close_arr[-21] - 1
         
-        # Momentum features
-        momentum_5d = (close_prices.iloc[-1] / close_prices.iloc[-6]) - 1
-        momentum_20d = (close_prices.iloc[-1] / close_prices.iloc[-21]) - 1
+            # Volume analysis
+            avg_volume = np.nanmean(volume_arr[-20:], dtype=np.float64)
+            recent_volume = np.nanmean(volume_arr[-5:], dtype=np.float64)
+            volume_ratio = recent_volume / avg_volume
         
-        # Volume analysis
-        avg_volume = spy_data['Volume'].tail(20).mean()
-        recent_volume = spy_data['Volume'].tail(5).mean()
-        volume_ratio = recent_volume / avg_volume
+        trend_strength = (current_price - sma_20) / sma_20
         
         # VIX level (if available)
         vix_level = 20  # Default
@@ -208,9 +385,9 @@ class MarketConditionAnalyzer:
             vix_level = vix_data['Close'].iloc[-1]
         
         # Market trend classification
-        if close_prices.iloc[-1] > sma_20.iloc[-1] > sma_50.iloc[-1]:
+        if current_price > sma_20 > sma_50:
             trend = 'BULLISH'
-        elif close_prices.iloc[-1] < sma_20.iloc[-1] < sma_50.iloc[-1]:
+        elif current_price < sma_20 < sma_50:
             trend = 'BEARISH'
         else:
             trend = 'SIDEWAYS'
@@ -225,57 +402,43 @@ class MarketConditionAnalyzer:
             'vix_level': vix_level,
             'trend': trend,
             'current_price': current_price,
-            'sma_20': sma_20.iloc[-1],
-            'sma_50': sma_50.iloc[-1]
+            'sma_20': sma_20,
+            'sma_50': sma_50
         }
     
     def _classify_market_condition(self, features: Dict) -> str:
         """Classify market condition based on features"""
-        # High volatility condition
-        if features['volatility_20d'] > 0.25 or features['vix_level'] > 30:
-            return 'HIGH_VOLATILITY'
-        
-        # Low volatility condition
-        if features['volatility_20d'] < 0.15 and features['vix_level'] < 15:
-            return 'LOW_VOLATILITY'
-        
-        # Trending condition
-        if abs(features['momentum_20d']) > 0.05 and abs(features['trend_strength']) > 0.03:
-            return 'TRENDING'
-        
-        # Range-bound condition (default for 2025 market)
-        return 'RANGE_BOUND'
+        key = (
+            _band(features['volatility_20d'], _LOW_VOL, _HIGH_VOL),
+            _band(features['vix_level'], _LOW_VIX, _HIGH_VIX),
+            abs(features['momentum_20d']) > _TREND_MOMENTUM,
+            abs(features['trend_strength']) > _TREND_STRENGTH
+        )
+        return _CONDITION_RULES[key]
     
     def _calculate_condition_confidence(self, features: Dict) -> float:
         """Calculate confidence in the market condition classification"""
         base_confidence = 0.6
         
         # Higher confidence for extreme readings
-        if features['vix_level'] > 35 or features['vix_level'] < 12:
+        if features['vix_level'] > _EXTREME_VIX_HIGH or features['vix_level'] < _EXTREME_VIX_LOW:
             base_confidence += 0.2
         
-        if features['volatility_20d'] > 0.3 or features['volatility_20d'] < 0.1:
+        if features['volatility_20d'] > _EXTREME_VOL_HIGH or features['volatility_20d'] < _EXTREME_VOL_LOW:
             base_confidence += 0.15
         
-        if abs(features['momentum_20d']) > 0.08:
+        if abs(features['momentum_20d']) > _STRONG_MOMENTUM:
             base_confidence += 0.1
         
         return min(base_confidence, 0.95)
     
     def _get_recommended_strategy(self, condition: str, features: Dict) -> str:
         """Get recommended trading strategy based on market condition"""
-        strategy_map = {
-            'RANGE_BOUND': 'BollingerMeanReversion',
-            'HIGH_VOLATILITY': 'IronCondor',
-            'LOW_VOLATILITY': 'CoveredCall',
-            'TRENDING': 'Momentum'
-        }
-        
         # Special case for 2025 market conditions
         if features['vix_level'] > 25 and condition == 'RANGE_BOUND':
             return 'BollingerMeanReversion'  # Perfect for current market
         
-        return strategy_map.get(condition, 'BollingerMeanReversion')
+        return _STRATEGY_MAP.get(condition, 'BollingerMeanReversion')
     
     def _default_condition(self) -> Dict:
         """Return default market condition when insufficient data"""
@@ -1,7 +1,7 @@
 # Authentication module for trading system
 
 from .credentials import CredentialManager
-from .login_manager import LoginManager
+from .login_manager import LoginManager, RetryPolicy
 from .session_manager import SessionManager
 
-__all__ = ['CredentialManager', 'LoginManager', 'SessionManager']
\ No newline at end of file
+__all__ = ['CredentialManager', 'LoginManager', 'RetryPolicy', 'SessionManager']
\ No newline at end of file
@@ -1,9 +1,28 @@
 # auth/credentials.py
 import os
 import json
+import base64
 import logging
 from datetime import datetime
+from typing import Optional
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# Prefix of AES-GCM credential files (header + 12-byte nonce + ciphertext); anything
+# else is a legacy Fernet token, which is base64 text
+_AESGCM_HEADER = b'\x00AESGCM1'
+_AESGCM_NONCE_SIZE = 12
+
+# HKDF context that separates the AES-GCM key from the Fernet key it is derived from
+_AESGCM_KDF_INFO = b'trading-credentials aes-256-gcm'
 
 class CredentialManager:
     """Handles encrypted credential storage and retrieval"""
@@ -11,13 +30,18 @@ class CredentialManager:
     def __init__(self, credentials_file="trading_credentials.enc", key_file="trading_key.key", logger=None):
         self.credentials_file = credentials_file
         self.key_file = key_file
+        self.info_file = credentials_file + '.meta'
+        self.token_cache_file = credentials_file + '.tokens'
         self.logger = logger or logging.getLogger(__name__)
+        self._aesgcm = None
+        self._fernet = None
     
     def generate_key(self):
         """Generate encryption key for credentials"""
         key = Fernet.generate_key()
-        with open(self.key_file, 'wb') as f:
-            f.write(key)
+        self._write_private_file(self.key_file, key)
+        self._aesgcm = None
+        self._fernet = None
         return key
     
     def load_key(self):
@@ -29,20 +53,64 @@ class CredentialManager:
             self.logger.error(f"Encryption key file {self.key_file} not found!")
             return None
     
-    def encrypt_credentials(self, username: str, password: str, trading_pin: str, did: str = None) -> bool:
-        """Encrypt and store trading credentials"""
+    def _load_key_checked(self) -> bytes:
+        """Load the key file contents, raising if it cannot be read"""
+        key = self.load_key()
+        if key is None:
+            raise Exception("Could not load encryption key")
+        return key
+    
+    def _get_aesgcm(self) -> AESGCM:
+        """Return the AES-256-GCM cipher for the key file, loading the key on first use"""
+        if self._aesgcm is None:
+            # The key file is a Fernet key, which also decrypts legacy files, so the GCM key
+            # is derived from it rather than reusing the same bytes for both algorithms
+            hkdf = HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=_AESGCM_KDF_INFO)
+            self._aesgcm = AESGCM(hkdf.derive(base64.urlsafe_b64decode(self._load_key_checked())))
+        return self._aesgcm
+    
+    def _get_fernet(self) -> Fernet:
+        """Return the Fernet instance used to read credentials saved before AES-GCM"""
+        if self._fernet is None:
+            self._fernet = Fernet(self._load_key_checked())
+        return self._fernet
+    
+    def _encrypt(self, data: bytes) -> bytes:
+        """Encrypt with AES-GCM under a fresh random nonce"""
+        nonce = os.urandom(_AESGCM_NONCE_SIZE)
+        return _AESGCM_HEADER + nonce + self._get_aesgcm().encrypt(nonce, data, None)
+    
+    def _decrypt(self, token: bytes) -> bytes:
+        """Decrypt an AES-GCM credentials file, or a legacy Fernet token"""
+        if not token.startswith(_AESGCM_HEADER):
+            return self._get_fernet().decrypt(token)
+        nonce_end = len(_AESGCM_HEADER) + _AESGCM_NONCE_SIZE
+        return self._get_aesgcm().decrypt(token[len(_AESGCM_HEADER):nonce_end], token[nonce_end:], None)
+    
+    @staticmethod
+    def _pack_credentials(credentials: dict) -> bytes:
+        """Serialize credentials for encryption (msgpack when available, else JSON)"""
+        if MSGPACK_AVAILABLE:
+            return msgpack.packb(credentials, use_bin_type=True)
+        return json.dumps(credentials).encode()
+    
+    @staticmethod
+    def _unpack_credentials(data: bytes) -> dict:
+        """Deserialize decrypted credentials; JSON blobs from older files start with '{'"""
+        if data[:1] == b'{':
+            return json.loads(data.decode())
+        if not MSGPACK_AVAILABLE:
+            raise Exception("Credentials were saved with msgpack, which is not installed")
+        return msgpack.unpackb(data, raw=False)
+    
+    def encrypt_credentials(self, username: str, password: str, trading_pin: str, did: str = None,
+                            extra: dict = None) -> bool:
+        """Encrypt and store trading credentials; extra fields (e.g. dates) override the defaults"""
         try:
             # Generate or load key
             if not os.path.exists(self.key_file):
-                key = self.generate_key()
+                self.generate_key()
                 self.logger.info("Generated new encryption key")
-            else:
-                key = self.load_key()
-            
-            if key is None:
-                raise Exception("Could not load encryption key")
-            
-            f = Fernet(key)
             
             # Create credentials dictionary
             credentials = {
@@ -52,14 +120,15 @@ class CredentialManager:
                 'did': did,
                 'created_date': datetime.now().isoformat()
             }
+            credentials.update(extra or {})
             
             # Encrypt credentials
-            credentials_json = json.dumps(credentials)
-            encrypted_credentials = f.encrypt(credentials_json.encode())
+            encrypted_credentials = self._encrypt(self._pack_credentials(credentials))
+            
+            # Save encrypted credentials atomically so a crash never leaves a truncated file
+            self._write_private_file(self.credentials_file, encrypted_credentials)
             
-            # Save encrypted credentials
-            with open(self.credentials_file, 'wb') as file:
-                file.write(encrypted_credentials)
+            self._write_credential_info(credentials)
             
             self.logger.info("Credentials encrypted and saved successfully")
             return True
@@ -68,6 +137,52 @@ class CredentialManager:
             self.logger.error(f"Failed to encrypt credentials: {e}")
             return False
     
+    @staticmethod
+    def _write_private_file(path: str, data: bytes):
+        """Atomically replace path with data, readable by the owner only"""
+        tmp_file = path + '.tmp'
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o600)
+        try:
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_file)
+            except OSError:
+                pass
+            raise
+    
+    def save_token_cache(self, tokens: dict) -> bool:
+        """Encrypt and store cached login tokens; an empty dict removes the cache file"""
+        try:
+            if not tokens:
+                if os.path.exists(self.token_cache_file):
+                    os.remove(self.token_cache_file)
+                return True
+            
+            self._write_private_file(self.token_cache_file, self._encrypt(self._pack_credentials(tokens)))
+            return True
+        except Exception as e:
+            self.logger.warning(f"Could not save token cache: {e}")
+            return False
+    
+    def load_token_cache(self) -> dict:
+        """Load cached login tokens, or an empty dict if there are none"""
+        try:
+            if not os.path.exists(self.token_cache_file):
+                return {}
+            with open(self.token_cache_file, 'rb') as file:
+                return self._unpack_credentials(self._decrypt(file.read()))
+        except Exception as e:
+            self.logger.warning(f"Could not load token cache: {e}")
+            return {}
+    
     def load_credentials(self) -> dict:
         """Load and decrypt trading credentials"""
         try:
@@ -78,19 +193,12 @@ class CredentialManager:
             if not os.path.exists(self.key_file):
                 raise FileNotFoundError(f"Key file {self.key_file} not found")
             
-            # Load key and decrypt
-            key = self.load_key()
-            if key is None:
-                raise Exception("Could not load encryption key")
-            
-            f = Fernet(key)
-            
             # Read and decrypt credentials
             with open(self.credentials_file, 'rb') as file:
                 encrypted_credentials = file.read()
             
-            decrypted_credentials = f.decrypt(encrypted_credentials)
-            credentials = json.loads(decrypted_credentials.decode())
+            decrypted_credentials = self._decrypt(encrypted_credentials)
+            credentials = self._unpack_credentials(decrypted_credentials)
             
             self.logger.info("Credentials loaded successfully")
             return credentials
@@ -106,10 +214,17 @@ class CredentialManager:
     def delete_credentials(self) -> bool:
         """Delete stored credentials (for security)"""
         try:
+            self._aesgcm = None
+            self._fernet = None
+            
             if os.path.exists(self.credentials_file):
                 os.remove(self.credentials_file)
                 self.logger.info("Credentials file deleted")
             
+            for path in (self.info_file, self.token_cache_file):
+                if os.path.exists(path):
+                    os.remove(path)
+            
             if os.path.exists(self.key_file):
                 os.remove(self.key_file)
                 self.logger.info("Key file deleted")
@@ -136,15 +251,18 @@ class CredentialManager:
             if did is not None:
                 current_creds['did'] = did
             
-            # Update timestamp
-            current_creds['updated_date'] = datetime.now().isoformat()
+            # Keep the original creation date and stamp the update
+            timestamps = {'updated_date': datetime.now().isoformat()}
+            if current_creds.get('created_date'):
+                timestamps['created_date'] = current_creds['created_date']
             
             # Re-encrypt and save
             return self.encrypt_credentials(
                 current_creds['username'],
                 current_creds['password'],
                 current_creds['trading_pin'],
-                current_creds.get('did')
+                current_creds.get('did'),
+                extra=timestamps
             )
             
         except Exception as e:
@@ -162,12 +280,41 @@ class CredentialManager:
         
         return True
     
+    def _write_credential_info(self, credentials: dict):
+        """Write the non-sensitive credential fields to a plaintext sidecar file"""
+        info = {
+            'exists': True,
+            'username': credentials.get('username', 'Unknown'),
+            'created_date': credentials.get('created_date', 'Unknown'),
+            'updated_date': credentials.get('updated_date'),
+            'has_did': bool(credentials.get('did'))
+        }
+        try:
+            # The sidecar holds the username, so it gets the same 0600 permissions as the credentials
+            self._write_private_file(self.info_file, json.dumps(info).encode())
+        except OSError as e:
+            self.logger.warning(f"Could not write credential info file: {e}")
+    
+    def _read_credential_info(self) -> Optional[dict]:
+        """Read the sidecar info file, or None if it is missing or older than the credentials"""
+        try:
+            if os.path.getmtime(self.info_file) < os.path.getmtime(self.credentials_file):
+                return None
+            with open(self.info_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
     def get_credential_info(self) -> dict:
         """Get non-sensitive info about stored credentials"""
         try:
             if not self.credentials_exist():
                 return {'exists': False}
             
+            info = self._read_credential_info()
+            if info is not None:
+                return info
+            
             credentials = self.load_credentials()
             
             return {
@@ -1,171 +1,480 @@
 # auth/login_manager.py
+import asyncio
 import time
+import random
+import re
 import logging
-import requests
-from typing import Tuple, Dict
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Tuple, Dict, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .credentials import CredentialManager
 
+# Clock for in-process deadlines and caches; immune to wall-clock jumps (NTP, DST, VM resume).
+# Expiry times that are persisted or come from Webull use time.time() instead
+_now = time.monotonic
+
+# Network-related exceptions: requests' ConnectionError/Timeout and the builtin
+# ConnectionError/TimeoutError are all OSError subclasses
+_RETRYABLE_EXCEPTIONS = (OSError,)
+
+# How often a login queued for the login semaphore checks whether it was cancelled
+_PERMIT_POLL_SECONDS = 0.25
+
+# Webull login error codes and message fragments that mean retrying cannot help. They are
+# searched case-insensitively in one regex pass over "<code>\0<msg>"
+_NON_RETRYABLE_ERRORS = re.compile('|'.join(map(re.escape, (
+    'phone.illegal',
+    'user.passwd.error',
+    'account.freeze',
+    'account.lock',
+    'user.not.exist',
+    'invalid username',
+    'invalid password',
+    'account suspended',
+    'account locked',
+    'user not found'
+))), re.IGNORECASE)
+
+# Webull client attributes saved to and restored from the login token cache
+_CACHED_TOKEN_FIELDS = ('_access_token', '_refresh_token', '_token_expire', '_uuid',
+                        '_trade_token', '_account_id', 'zone_var')
+
+@dataclass
+class RetryPolicy:
+    """Backoff schedule for a retried operation"""
+    base_delay: float  # seconds before the first retry
+    max_delay: float
+    multiplier: float = 2.0
+    increment: float = 0.0  # added per attempt, for linear schedules
+    jitter: float = 0.5  # fraction of each delay that is randomized
+    max_attempts: int = 3
+    
+    def next_delay(self, attempt: int) -> float:
+        """Delay before retrying after the given (1-based) failed attempt"""
+        steps = attempt - 1
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** steps + self.increment * steps)
+        # Randomize the tail of the delay so retries from many clients spread out
+        return random.uniform(delay * (1 - self.jitter), delay)
+
 class LoginManager:
     """Handles login operations with retry logic and error handling"""
     
-    def __init__(self, wb, credential_manager: CredentialManager = None, logger=None):
+    # Process-wide cap on login flows running at once, so workers re-logging in together
+    # don't multiply load on the auth endpoint; the permit is given up during backoff waits.
+    # Change it once at startup with set_max_concurrent_logins(), which rebuilds the semaphore
+    MAX_CONCURRENT_LOGINS = 2
+    _LOGIN_SEMAPHORE = threading.BoundedSemaphore(MAX_CONCURRENT_LOGINS)
+    
+    # Cached tokens are only reused while both have more than TOKEN_REFRESH_MARGIN seconds left;
+    # Webull doesn't report the trade token's expiry, so it is assumed to last TRADE_TOKEN_TTL
+    TOKEN_REFRESH_MARGIN = 60
+    TRADE_TOKEN_TTL = 1800
+    
+    # Circuit breaker: after BREAKER_FAIL_MAX consecutive network failures, login_automatically
+    # fails fast for BREAKER_RESET_TIMEOUT seconds instead of sleeping through its backoff
+    BREAKER_FAIL_MAX = 5
+    BREAKER_RESET_TIMEOUT = 120
+    
+    __slots__ = (
+        'wb', 'credential_manager', 'logger', 'is_logged_in', 'last_login_error',
+        'login_retry', 'token_retry', 'max_total_seconds', '_cancel', '_status_ttl',
+        '_status_cached_until', '_flight_lock', '_in_flight', '_token_cache',
+        '_network_failures', '_breaker_open_until', '_io_pool', '_login_permit'
+    )
+    
+    def __init__(self, wb, credential_manager: CredentialManager = None, logger=None,
+                 login_retry: RetryPolicy = None, token_retry: RetryPolicy = None):
         self.wb = wb
+        self._configure_http_session()
         self.credential_manager = credential_manager or CredentialManager()
         self.logger = logger or logging.getLogger(__name__)
         self.is_logged_in = False
+        self.last_login_error = None  # Reason the most recent login_automatically call failed
+        
+        # Login retry settings: up to 30, 60, 120 seconds between logins, 10, 20 between trade tokens
+        self.login_retry = login_retry or RetryPolicy(base_delay=30, max_delay=300)
+        self.token_retry = token_retry or RetryPolicy(base_delay=10, max_delay=60, multiplier=1.0, increment=10)
+        self.max_total_seconds = 600  # Overall budget for one login_automatically call
+        
+        # Set by cancel() to cut short a login queued for a permit or waiting out its backoff
+        self._cancel = threading.Event()
+        
+        # check_login_status trusts a successful check for this many seconds, so health checks
+        # polled every few seconds don't each cost a Webull request
+        self._status_ttl = 20.0
+        self._status_cached_until = 0.0
+        
+        # Concurrent callers of login_automatically / check_login_status share the result of
+        # the call already in flight: {name: Future}
+        self._flight_lock = threading.Lock()
+        self._in_flight = {}
+        
+        # {username: tokens} from recent logins, loaded from disk on first use
+        self._token_cache = None
         
-        # Login retry settings
-        self.max_login_attempts = 3
-        self.base_login_delay = 30  # seconds
-        self.max_trade_token_attempts = 3
-        self.base_trade_token_delay = 10  # seconds
+        # Consecutive login attempts that failed to reach Webull, see BREAKER_FAIL_MAX
+        self._network_failures = 0
+        self._breaker_open_until = 0.0
+        
+        # Worker threads for login_automatically_async, created on demand
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='auth')
+        
+        # (thread id, semaphore) while a login flow holds a login permit, see _sleep
+        self._login_permit = None
+    
+    @classmethod
+    def set_max_concurrent_logins(cls, limit: int):
+        """Change the process-wide login limit; call before any login starts"""
+        if limit < 1:
+            raise ValueError("max_concurrent_logins must be at least 1")
+        cls.MAX_CONCURRENT_LOGINS = limit
+        cls._LOGIN_SEMAPHORE = threading.BoundedSemaphore(limit)
+    
+    def close(self):
+        """Wait for a pending login_automatically_async call and release its worker threads"""
+        self._io_pool.shutdown(wait=True)
     
     def login_automatically(self) -> bool:
         """Automated login using stored credentials with retry logic"""
-        for attempt in range(1, self.max_login_attempts + 1):
+        return self._single_flight('Login', self._login_with_semaphore)
+    
+    def _login_with_semaphore(self) -> bool:
+        """Run the login flow under the process-wide login semaphore"""
+        # Cleared before queueing for a permit, so a cancel() that arrives meanwhile sticks
+        self._cancel.clear()
+        permit = self._LOGIN_SEMAPHORE
+        if not self._acquire_permit(permit):
+            self.last_login_error = "Login cancelled"
+            self.logger.warning("⚠️ Login cancelled while waiting for a login slot")
+            return False
+        
+        self._login_permit = (threading.get_ident(), permit)
+        try:
+            return self._login_automatically()
+        finally:
+            # _sleep gives the permit up for good if the login was cancelled during a backoff
+            if self._login_permit is not None:
+                self._login_permit = None
+                permit.release()
+    
+    def _acquire_permit(self, permit: threading.BoundedSemaphore) -> bool:
+        """Wait for a login permit; returns False if cancel() was called first"""
+        while not self._cancel.is_set():
+            if permit.acquire(timeout=_PERMIT_POLL_SECONDS):
+                return True
+        return False
+    
+    def _single_flight(self, name: str, func):
+        """Run func, or wait for and return the result of the `name` call already in flight"""
+        with self._flight_lock:
+            in_flight = self._in_flight.get(name)
+            if in_flight is None:
+                future = self._in_flight[name] = Future()
+        
+        if in_flight is not None:
+            self.logger.info("⏳ %s already in progress, waiting for its result...", name)
+            return in_flight.result()
+        
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._flight_lock:
+                del self._in_flight[name]
+    
+    def _configure_http_session(self):
+        """Mount a pooled keep-alive adapter on the Webull client's requests session"""
+        session = getattr(self.wb, '_session', None)
+        if session is None:
+            return
+        
+        # A failed connect sends nothing, so it is safe to retry for any method; doing it here
+        # avoids a full login backoff for a transient connection error
+        retry = Retry(total=2, connect=2, read=0, status=0, other=0, backoff_factor=0.5)
+        session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+    
+    async def login_automatically_async(self) -> bool:
+        """login_automatically for asyncio callers; the blocking flow runs on a worker thread"""
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._io_pool, self.login_automatically)
+        except asyncio.CancelledError:
+            # The worker thread can't be interrupted, but its backoff waits can
+            self.cancel()
+            raise
+    
+    def _login_automatically(self) -> bool:
+        """login_automatically body, run while holding the login semaphore"""
+        self.last_login_error = None
+        
+        if _now() < self._breaker_open_until:
+            self.last_login_error = "Webull unreachable, skipping login until the circuit breaker resets"
+            self.logger.warning("⚡ %s (%.0fs left)", self.last_login_error, self._breaker_open_until - _now())
+            return False
+        
+        # Credentials don't change between attempts, so load and validate them once
+        try:
+            credentials = self.credential_manager.load_credentials()
+        except Exception as e:
+            self.last_login_error = f"Could not load stored credentials: {e}"
+            self.logger.error("❌ %s", self.last_login_error)
+            return False
+        
+        if not self.credential_manager.validate_credentials(credentials):
+            self.last_login_error = "Invalid credentials found"
+            self.logger.error("❌ Invalid credentials found")
+            return False
+        
+        if self._load_cached_login(credentials['username']):
+            return True
+        
+        deadline = _now() + self.max_total_seconds
+        did_set = False
+        max_attempts = self.login_retry.max_attempts
+        for attempt in range(1, max_attempts + 1):
             try:
-                self.logger.info(f"Starting automated login attempt {attempt}/{self.max_login_attempts}...")
-                
-                # Load credentials
-                credentials = self.credential_manager.load_credentials()
-                
-                # Validate credentials
-                if not self.credential_manager.validate_credentials(credentials):
-                    self.logger.error("❌ Invalid credentials found")
-                    return False
+                self.logger.info("Attempting automated Webull login %s/%s...", attempt, max_attempts,
+                                 extra={'event': 'login_attempt', 'attempt': attempt, 'status': 'start'})
                 
                 # Set DID if provided
-                if credentials.get('did'):
+                if credentials.get('did') and not did_set:
                     self.wb._set_did(credentials['did'])
+                    did_set = True
                     self.logger.info("DID set from stored credentials")
                 
                 # Login to Webull
-                self.logger.info("Attempting Webull login...")
                 login_result = self.wb.login(
                     username=credentials['username'],
                     password=credentials['password']
                 )
+                self._network_failures = 0  # Webull answered
+                
+                # Check login result, getting the trade token with retries on success
+                token_obtained = self._finalize_login(login_result, credentials['username'],
+                                                      credentials['trading_pin'])
+                if token_obtained:
+                    self.logger.info("✅ Complete login process successful",
+                                     extra={'event': 'login_attempt', 'attempt': attempt, 'status': 'success'})
+                    return True
+                elif token_obtained is not None:
+                    self.last_login_error = "Failed to get trade token after retries"
+                    self.logger.error("❌ Failed to get trade token after retries")
+                    # Continue to retry loop for complete login failure
                 
-                # Check login result
-                if 'accessToken' in login_result:
-                    self.logger.info("✅ Webull login successful")
-                    self.is_logged_in = True
-                    
-                    # Try to get trade token with retries
-                    if self._get_trade_token_with_retry(credentials['trading_pin']):
-                        self.logger.info("✅ Complete login process successful")
-                        return True
-                    else:
-                        self.logger.error("❌ Failed to get trade token after retries")
-                        # Continue to retry loop for complete login failure
-                        
                 else:
                     # Analyze login failure
                     error_msg = login_result.get('msg', 'Unknown error')
                     error_code = login_result.get('code', 'unknown')
+                    self.last_login_error = f"{error_msg} (Code: {error_code})"
                     
-                    self.logger.warning(f"❌ Login attempt {attempt} failed: {error_msg} (Code: {error_code})")
+                    self.logger.warning("❌ Login attempt %s failed: %s (Code: %s)", attempt, error_msg, error_code,
+                                        extra={'event': 'login_attempt', 'attempt': attempt, 'status': 'rejected',
+                                               'code': error_code})
                     
                     # Check if this is a retryable error
                     if not self._is_retryable_login_error(login_result):
-                        self.logger.error(f"❌ Non-retryable login error: {error_msg}")
+                        self.logger.error("❌ Non-retryable login error: %s", error_msg)
                         return False
                 
             except Exception as e:
-                self.logger.warning(f"❌ Login attempt {attempt} exception: {e}")
+                self.last_login_error = f"Exception: {e}"
+                self.logger.warning("❌ Login attempt %s exception: %s", attempt, e,
+                                    extra={'event': 'login_attempt', 'attempt': attempt, 'status': 'error'})
+                
+                if isinstance(e, _RETRYABLE_EXCEPTIONS) and self._record_network_failure():
+                    return False
                 
                 # Check if this is a retryable exception
                 if not self._is_retryable_exception(e):
-                    self.logger.error(f"❌ Non-retryable exception during login: {e}")
+                    self.logger.error("❌ Non-retryable exception during login: %s", e)
                     return False
             
+            # No backoff after the final attempt
+            if attempt == max_attempts:
+                break
+            
             # If we get here, we need to retry
-            if attempt < self.max_login_attempts:
-                # Calculate delay with exponential backoff
-                delay = self.base_login_delay * (2 ** (attempt - 1))  # 30, 60, 120 seconds
-                delay = min(delay, 300)  # Cap at 5 minutes
-                
-                self.logger.info(f"⏳ Waiting {delay} seconds before retry {attempt + 1}...")
-                time.sleep(delay)
-            else:
-                self.logger.error(f"❌ All {self.max_login_attempts} login attempts failed")
+            delay = self.login_retry.next_delay(attempt)
+            
+            # Never wait past the overall deadline
+            remaining = deadline - _now()
+            if remaining <= 0:
+                self.logger.warning("⏰ Login time budget of %ss exhausted after attempt %s",
+                                    self.max_total_seconds, attempt)
+                break
+            delay = min(delay, remaining)
+            
+            self.logger.info("⏳ Waiting %.1f seconds before retry %s...", delay, attempt + 1)
+            if not self._sleep(delay):
+                self.last_login_error = "Login cancelled"
+                self.logger.warning("⚠️ Login cancelled")
+                return False
         
+        self.logger.error("❌ All %s login attempts failed (last error: %s)",
+                          max_attempts, self.last_login_error)
         return False
     
+    def _record_network_failure(self) -> bool:
+        """Count a login attempt that couldn't reach Webull; returns True if the breaker tripped"""
+        self._network_failures += 1
+        if self._network_failures < self.BREAKER_FAIL_MAX:
+            return False
+        
+        self._network_failures = 0
+        self._breaker_open_until = _now() + self.BREAKER_RESET_TIMEOUT
+        self.logger.error("⚡ %s consecutive network failures, not retrying login for %ss",
+                          self.BREAKER_FAIL_MAX, self.BREAKER_RESET_TIMEOUT)
+        return True
+    
+    def _finalize_login(self, login_result: Dict, username: str, trading_pin: str,
+                        retry: bool = True) -> Optional[bool]:
+        """
+        Complete a login once Webull has answered
+        
+        Returns:
+            None if the login was rejected, otherwise whether the trade token was obtained
+        """
+        if 'accessToken' not in login_result:
+            return None
+        
+        self.logger.info("✅ Webull login successful")
+        self.is_logged_in = True
+        
+        if retry:
+            token_obtained = self._get_trade_token_with_retry(trading_pin)
+        else:
+            token_obtained = bool(self.wb.get_trade_token(trading_pin))
+        
+        if token_obtained:
+            self._cache_tokens(username)
+        return token_obtained
+    
+    def _get_token_cache(self) -> Dict:
+        """Return the token cache, loading it from disk on first use"""
+        if self._token_cache is None:
+            self._token_cache = self.credential_manager.load_token_cache()
+        return self._token_cache
+    
+    def _load_cached_login(self, username: str) -> bool:
+        """Reuse unexpired tokens from an earlier login instead of logging in again"""
+        entry = self._get_token_cache().get(username)
+        if not entry:
+            return False
+        
+        if min(entry['access_exp'], entry['trade_exp']) - time.time() <= self.TOKEN_REFRESH_MARGIN:
+            self.logger.info("Cached login tokens have expired")
+            self._forget_tokens(username)
+            return False
+        
+        for field in _CACHED_TOKEN_FIELDS:
+            setattr(self.wb, field, entry[field])
+        
+        self.invalidate_status()
+        if not self.check_login_status():
+            self.logger.info("Cached login tokens were rejected, logging in again")
+            self._forget_tokens(username)
+            return False
+        
+        self.logger.info("✅ Reused cached login tokens")
+        return True
+    
+    def _cache_tokens(self, username: str):
+        """Remember the Webull client's current tokens for username"""
+        wb_state = getattr(self.wb, '__dict__', {})
+        access_exp = self._parse_token_expire(wb_state.get('_token_expire'))
+        if access_exp is None:
+            return
+        
+        entry = {field: wb_state.get(field) for field in _CACHED_TOKEN_FIELDS}
+        entry['access_exp'] = access_exp
+        entry['trade_exp'] = time.time() + self.TRADE_TOKEN_TTL
+        
+        token_cache = self._get_token_cache()
+        token_cache[username] = entry
+        self.credential_manager.save_token_cache(token_cache)
+    
+    def _forget_tokens(self, username: str = None):
+        """Drop the cached tokens for username, or for everyone if no username is given"""
+        token_cache = self._get_token_cache()
+        if username is None:
+            token_cache.clear()
+        elif token_cache.pop(username, None) is None:
+            return
+        self.credential_manager.save_token_cache(token_cache)
+    
+    @staticmethod
+    def _parse_token_expire(token_expire) -> Optional[float]:
+        """Convert Webull's tokenExpireTime to a Unix timestamp, or None if it can't be parsed"""
+        try:
+            return datetime.fromisoformat(token_expire.replace('+0000', '+00:00')).timestamp()
+        except (AttributeError, TypeError, ValueError):
+            return None
+    
     def _get_trade_token_with_retry(self, trading_pin: str) -> bool:
         """Get trade token with retry logic"""
-        for attempt in range(1, self.max_trade_token_attempts + 1):
+        max_attempts = self.token_retry.max_attempts
+        for attempt in range(1, max_attempts + 1):
             try:
-                self.logger.info(f"Getting trade token (attempt {attempt}/{self.max_trade_token_attempts})...")
+                self.logger.info("Getting trade token (attempt %s/%s)...", attempt, max_attempts)
                 
                 if self.wb.get_trade_token(trading_pin):
                     self.logger.info("✅ Trade token obtained successfully")
                     return True
                 else:
-                    self.logger.warning(f"❌ Trade token attempt {attempt} failed")
+                    self.logger.warning("❌ Trade token attempt %s failed", attempt)
                     
             except Exception as e:
-                self.logger.warning(f"❌ Trade token attempt {attempt} exception: {e}")
+                self.logger.warning("❌ Trade token attempt %s exception: %s", attempt, e)
             
             # Wait before retry (except on last attempt)
-            if attempt < self.max_trade_token_attempts:
-                delay = self.base_trade_token_delay * attempt  # 10, 20 seconds
-                self.logger.info(f"⏳ Waiting {delay} seconds before trade token retry...")
-                time.sleep(delay)
+            if attempt < max_attempts:
+                delay = self.token_retry.next_delay(attempt)
+                self.logger.info("⏳ Waiting %.1f seconds before trade token retry...", delay)
+                if not self._sleep(delay):
+                    self.logger.warning("⚠️ Trade token retry cancelled")
+                    return False
         
-        self.logger.error(f"❌ Failed to get trade token after {self.max_trade_token_attempts} attempts")
+        self.logger.error("❌ Failed to get trade token after %s attempts", max_attempts)
         return False
     
+    def _sleep(self, delay: float) -> bool:
+        """Wait for delay seconds; returns False if cancel() was called meanwhile"""
+        holder = self._login_permit
+        if holder is None or holder[0] != threading.get_ident():
+            return not self._cancel.wait(delay)
+        # Let other logins run while this one backs off
+        permit = holder[1]
+        permit.release()
+        if self._cancel.wait(delay) or not self._acquire_permit(permit):
+            self._login_permit = None
+            return False
+        return True
+    
+    def cancel(self):
+        """Abort the backoff wait of a login in progress (e.g. on shutdown)"""
+        self._cancel.set()
+    
     def _is_retryable_login_error(self, login_result: Dict) -> bool:
         """Determine if a login error is retryable"""
-        error_code = login_result.get('code', '').lower()
-        error_msg = login_result.get('msg', '').lower()
-        
-        # Non-retryable errors (permanent failures)
-        non_retryable_codes = [
-            'phone.illegal',
-            'user.passwd.error',
-            'account.freeze',
-            'account.lock',
-            'user.not.exist'
-        ]
-        
-        non_retryable_messages = [
-            'invalid username',
-            'invalid password', 
-            'account suspended',
-            'account locked',
-            'user not found'
-        ]
-        
-        # Check for non-retryable conditions
-        for code in non_retryable_codes:
-            if code in error_code:
-                return False
-        
-        for msg in non_retryable_messages:
-            if msg in error_msg:
-                return False
+        error_code = login_result.get('code') or ''
+        error_msg = login_result.get('msg') or ''
         
-        # Default to retryable for unknown errors
-        return True
+        # Non-retryable errors (permanent failures); anything else defaults to retryable
+        return not _NON_RETRYABLE_ERRORS.search(f"{error_code}\0{error_msg}")
     
     def _is_retryable_exception(self, exception: Exception) -> bool:
         """Determine if an exception is retryable"""
         # Network-related exceptions are retryable
-        retryable_exceptions = [
-            requests.exceptions.ConnectionError,
-            requests.exceptions.Timeout,
-            requests.exceptions.ReadTimeout,
-            requests.exceptions.ConnectTimeout,
-            ConnectionError,
-            TimeoutError,
-            OSError  # Can include network issues
-        ]
-        
-        for exc_type in retryable_exceptions:
-            if isinstance(exception, exc_type):
-                return True
+        if isinstance(exception, _RETRYABLE_EXCEPTIONS):
+            return True
         
         # Default to retryable for unknown exceptions
         return True
@@ -186,62 +495,106 @@ class LoginManager:
                 question_answer=question_answer
             )
             
-            if 'accessToken' in login_result:
-                self.logger.info("✅ Login successful")
-                self.is_logged_in = True
-                
-                # Get trade token
-                if self.wb.get_trade_token(trading_pin):
-                    self.logger.info("✅ Trade token obtained")
-                    return True
-                else:
-                    self.logger.error("❌ Failed to get trade token")
-                    return False
+            token_obtained = self._finalize_login(login_result, username, trading_pin, retry=False)
+            if token_obtained is None:
+                self.logger.error("❌ Login failed: %s", login_result.get('msg', 'Unknown error'))
+                return False
+            
+            if token_obtained:
+                self.logger.info("✅ Trade token obtained")
+                return True
             else:
-                self.logger.error(f"❌ Login failed: {login_result.get('msg', 'Unknown error')}")
+                self.logger.error("❌ Failed to get trade token")
                 return False
                 
         except Exception as e:
-            self.logger.error(f"❌ Exception during login: {e}")
+            self.logger.error("❌ Exception during login: %s", e)
             return False
     
-    def logout(self) -> bool:
-        """Logout from Webull"""
+    def logout(self, wait: bool = False) -> bool:
+        """Logout from Webull; unless wait is set, the request is sent on a background thread"""
+        if not self.is_logged_in:
+            self.logger.info("Already logged out")
+            return True
+        
+        # Logging out invalidates the tokens server-side
+        self._forget_tokens()
+        
+        if wait:
+            return self._send_logout()
+        
+        # The session is being torn down either way, so don't block on the server's reply
+        self.is_logged_in = False
+        self.invalidate_status()
+        # A daemon thread, not _io_pool: interpreter exit joins pool workers and would wait on the reply
+        threading.Thread(target=self._send_logout, name='webull-logout', daemon=True).start()
+        return True
+    
+    def _send_logout(self) -> bool:
+        """Send the logout request to Webull"""
         try:
-            if self.is_logged_in:
-                response_code = self.wb.logout()
-                if response_code == 200:
-                    self.logger.info("🔐 Logged out successfully")
-                    self.is_logged_in = False
-                    return True
-                else:
-                    self.logger.warning(f"⚠️ Logout returned code: {response_code}")
-                    return False
-            else:
-                self.logger.info("Already logged out")
+            response_code = self.wb.logout()
+            if response_code == 200:
+                self.logger.info("🔐 Logged out successfully")
+                self.is_logged_in = False
+                self.invalidate_status()
                 return True
+            else:
+                self.logger.warning("⚠️ Logout returned code: %s", response_code)
+                return False
         except Exception as e:
-            self.logger.warning(f"⚠️ Logout warning: {e}")
+            self.logger.warning("⚠️ Logout warning: %s", e)
             return False
     
     def check_login_status(self) -> bool:
         """Check if currently logged in and properly initialize account context"""
+        # An access token that has already expired can't pass the check, so skip the round trip
+        token_expire = self._parse_token_expire(getattr(self.wb, '_token_expire', None))
+        if token_expire is not None and token_expire <= time.time():
+            self.logger.debug("Access token expired at %s, not querying Webull", self.wb._token_expire)
+            self.is_logged_in = False
+            self.invalidate_status()
+            return False
+        
+        if _now() < self._status_cached_until:
+            return self.is_logged_in
+        
+        return self._single_flight('Login status check', self._query_login_status)
+    
+    def _query_login_status(self) -> bool:
+        """Ask Webull whether the session is valid, initializing the account context"""
+        now = _now()
         try:
             # Try to make a simple API call to check login status
             # This also initializes the account context properly
             account_id = self.wb.get_account_id()
             if account_id:
                 self.is_logged_in = True
-                self.logger.info(f"Login status verified, account context initialized: {account_id}")
+                self._status_cached_until = now + self._status_ttl
+                self.logger.info("Login status verified, account context initialized: %s", account_id)
                 return True
             else:
+                # Webull rejected the session, so its cached tokens are no good either
                 self.is_logged_in = False
+                self._forget_tokens()
                 return False
         except Exception as e:
-            self.logger.debug(f"Login status check failed: {e}")
+            self.logger.debug("Login status check failed: %s", e)
             self.is_logged_in = False
+            # A network error says nothing about the tokens; anything else is a rejected session
+            if not isinstance(e, _RETRYABLE_EXCEPTIONS):
+                self._forget_tokens()
             return False
     
+    def mark_verified(self):
+        """Record that the session was just verified elsewhere (e.g. by SessionManager.load_session)"""
+        self.is_logged_in = True
+        self._status_cached_until = _now() + self._status_ttl
+    
+    def invalidate_status(self):
+        """Force the next check_login_status call to query Webull"""
+        self._status_cached_until = 0.0
+    
     def refresh_login(self) -> bool:
         """Refresh the login session if possible - DISABLED DUE TO ERRORS"""
         try:
@@ -264,16 +617,18 @@ class LoginManager:
             #     return False
                 
         except Exception as e:
-            self.logger.error(f"❌ Error in refresh login: {e}")
+            self.logger.error("❌ Error in refresh login: %s", e)
             self.is_logged_in = False
             return False
     
     def get_login_info(self) -> Dict:
         """Get information about current login status"""
+        # The token/account fields are plain instance attributes on the Webull client
+        wb_state = getattr(self.wb, '__dict__', {})
         return {
             'is_logged_in': self.is_logged_in,
-            'access_token_exists': bool(getattr(self.wb, '_access_token', None)),
-            'trade_token_exists': bool(getattr(self.wb, '_trade_token', None)),
-            'account_id': getattr(self.wb, '_account_id', None),
-            'uuid': getattr(self.wb, '_uuid', None)
+            'access_token_exists': bool(wb_state.get('_access_token')),
+            'trade_token_exists': bool(wb_state.get('_trade_token')),
+            'account_id': wb_state.get('_account_id'),
+            'uuid': wb_state.get('_uuid')
         }
\ No newline at end of file
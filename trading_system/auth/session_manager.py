@@ -2,16 +2,104 @@
 import json
 import logging
 import os
+import shutil
+import time
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Session fields that must be present and non-empty
+_REQUIRED_FIELDS = frozenset({'access_token', 'refresh_token', 'token_expire'})
+
+# Seconds before token expiry at which a session stops being reused, and maximum session age
+_EXPIRY_BUFFER = 5 * 60
+_MAX_SESSION_AGE = 12 * 3600
+
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO timestamp, accepting Webull's '+0000' UTC offset"""
+    if value.endswith('+0000'):
+        value = value[:-5] + '+00:00'
+    return datetime.fromisoformat(value)
 
 class SessionManager:
     """Manages trading session persistence and token management"""
     
     def __init__(self, session_file="webull_session.json", logger=None):
         self.session_file = session_file
+        self.packed_session_file = os.path.splitext(session_file)[0] + '.mp'
         self.logger = logger or logging.getLogger(__name__)
         self.session_data = {}
+        
+        # Last session that passed _is_session_valid, as its key fields, and when it stops being valid
+        self._validity_cache_key = None
+        self._valid_until = 0.0
+    
+    def _active_session_file(self) -> Optional[str]:
+        """Return the session file currently on disk, preferring MessagePack"""
+        if MSGPACK_AVAILABLE and os.path.exists(self.packed_session_file):
+            return self.packed_session_file
+        if os.path.exists(self.session_file):
+            return self.session_file
+        return None
+    
+    def _write_session_file(self, session_data: Dict) -> str:
+        """Write session data to disk and return the path written"""
+        if MSGPACK_AVAILABLE:
+            path, data = self.packed_session_file, msgpack.packb(session_data, use_bin_type=True)
+        elif ORJSON_AVAILABLE:
+            path, data = self.session_file, orjson.dumps(session_data, option=orjson.OPT_INDENT_2)
+        else:
+            path, data = self.session_file, json.dumps(session_data, indent=2).encode()
+        
+        # Write a temp file and rename it into place so a crash never leaves a partial session.
+        # No fsync: a session lost to a power cut only costs a fresh login
+        tmp_path = path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        return path
+    
+    def _read_session_file(self, path: str) -> Dict:
+        """Read session data from the given session file"""
+        if path == self.packed_session_file:
+            with open(path, 'rb', buffering=0) as f:
+                return msgpack.unpackb(f.readall(), raw=False)
+        
+        if ORJSON_AVAILABLE:
+            with open(path, 'rb') as f:
+                session_data = orjson.loads(f.read())
+        else:
+            with open(path, 'r') as f:
+                session_data = json.load(f)
+        
+        # One-time migration of legacy JSON sessions to MessagePack
+        if MSGPACK_AVAILABLE:
+            try:
+                self._write_session_file(session_data)
+                os.remove(path)
+                self.logger.info("Migrated session from %s to %s", path, self.packed_session_file)
+            except Exception as e:
+                self.logger.warning("Could not migrate legacy session file: %s", e)
+        
+        return session_data
     
     def save_session(self, wb) -> bool:
         """Save current session data"""
@@ -27,29 +115,29 @@ class SessionManager:
                 'saved_at': datetime.now().isoformat()
             }
             
-            with open(self.session_file, 'w') as f:
-                json.dump(session_data, f, indent=2)
+            session_path = self._write_session_file(session_data)
             
             self.session_data = session_data
-            self.logger.info(f"Session saved to {self.session_file}")
+            self.logger.info("Session saved to %s", session_path)
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to save session: {e}")
+            self.logger.error("Failed to save session: %s", e)
             return False
     
     def load_session(self, wb) -> bool:
         """Load session data into webull instance"""
         try:
-            if not os.path.exists(self.session_file):
+            session_path = self._active_session_file()
+            if session_path is None:
                 self.logger.info("No session file found")
                 return False
             
-            with open(self.session_file, 'r') as f:
-                session_data = json.load(f)
+            session_data = self._read_session_file(session_path)
             
             self.session_data = session_data
-            self.logger.debug(f"Loaded session data with keys: {list(session_data.keys())}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Loaded session data with keys: %s", list(session_data))
             
             # Check if session is still valid
             if not self._is_session_valid(session_data):
@@ -68,8 +156,8 @@ class SessionManager:
             wb.zone_var = session_data.get('zone_var', 'dc_core_r1')
             
             self.logger.info("Session loaded successfully")
-            self.logger.debug(f"Set zone_var to: {wb.zone_var}")
-            self.logger.debug(f"Set account_id to: {wb._account_id}")
+            self.logger.debug("Set zone_var to: %s", wb.zone_var)
+            self.logger.debug("Set account_id to: %s", wb._account_id)
             
             # IMPORTANT: Re-initialize account context to ensure proper API access
             # This is crucial for account discovery to work correctly
@@ -77,7 +165,7 @@ class SessionManager:
                 self.logger.debug("Attempting to re-initialize account context...")
                 account_id = wb.get_account_id()
                 if account_id:
-                    self.logger.info(f"Account context re-initialized: {account_id}")
+                    self.logger.info("Account context re-initialized: %s", account_id)
                     return True
                 else:
                     self.logger.warning("Failed to re-initialize account context - session may be expired")
@@ -85,87 +173,88 @@ class SessionManager:
                     self.clear_session()
                     return False
             except KeyError as e:
-                self.logger.warning(f"API response missing expected field {e} - session likely expired")
+                self.logger.warning("API response missing expected field %s - session likely expired", e)
                 self.logger.info("Clearing invalid session file")
                 self.clear_session()
                 return False
             except Exception as e:
-                self.logger.warning(f"Failed to re-initialize account context: {e} - session may be invalid")
+                self.logger.warning("Failed to re-initialize account context: %s - session may be invalid", e)
                 self.logger.info("Clearing invalid session file")
                 self.clear_session()
                 return False
             
         except Exception as e:
-            self.logger.error(f"Failed to load session: {e}")
+            self.logger.error("Failed to load session: %s", e)
             return False
     
     def _is_session_valid(self, session_data: Dict) -> bool:
         """Check if session data is still valid"""
+        now = time.time()
+        cache_key = (session_data.get('access_token'), session_data.get('refresh_token'),
+                     session_data.get('token_expire'), session_data.get('saved_at'))
+        if cache_key == self._validity_cache_key and now < self._valid_until:
+            return True
+        
         try:
             # Check if required fields exist
-            required_fields = ['access_token', 'refresh_token', 'token_expire']
-            for field in required_fields:
-                if not session_data.get(field):
-                    self.logger.debug(f"Missing required field: {field}")
-                    return False
+            missing = _REQUIRED_FIELDS.difference(key for key, value in session_data.items() if value)
+            if missing:
+                self.logger.debug("Missing required fields: %s", sorted(missing))
+                return False
             
-            # Check token expiration
-            token_expire = session_data.get('token_expire', '')
-            if token_expire:
-                try:
-                    # Parse the expiration time
-                    expire_time = datetime.fromisoformat(token_expire.replace('+0000', '+00:00'))
-                    current_time = datetime.now(expire_time.tzinfo)
-                    
-                    # Add 5 minute buffer
-                    if expire_time <= current_time + timedelta(minutes=5):
-                        self.logger.debug("Token is expired or expires soon")
-                        return False
-                        
-                except ValueError as e:
-                    self.logger.debug(f"Could not parse token expiration: {e}")
-                    return False
+            # Check token expiration, with a 5 minute buffer
+            try:
+                valid_until = _parse_iso(session_data['token_expire']).timestamp() - _EXPIRY_BUFFER
+            except ValueError as e:
+                self.logger.debug("Could not parse token expiration: %s", e)
+                return False
+            
+            if valid_until <= now:
+                self.logger.debug("Token is expired or expires soon")
+                return False
             
             # Check session age - be more conservative
             saved_at = session_data.get('saved_at', '')
             if saved_at:
                 try:
-                    saved_time = datetime.fromisoformat(saved_at)
-                    age = datetime.now() - saved_time
-                    
-                    # Sessions older than 12 hours are considered stale (reduced from 24)
-                    if age > timedelta(hours=12):
-                        self.logger.debug(f"Session is too old: {age.total_seconds()/3600:.1f} hours")
-                        return False
-                        
+                    saved_time = datetime.fromisoformat(saved_at).timestamp()
                 except ValueError as e:
-                    self.logger.debug(f"Could not parse saved time: {e}")
+                    self.logger.debug("Could not parse saved time: %s", e)
+                    return False
+                
+                # Sessions older than 12 hours are considered stale (reduced from 24)
+                if now - saved_time > _MAX_SESSION_AGE:
+                    self.logger.debug("Session is too old: %.1f hours", (now - saved_time) / 3600)
                     return False
+                valid_until = min(valid_until, saved_time + _MAX_SESSION_AGE)
             
             # Additional basic validation
-            access_token = session_data.get('access_token', '')
-            if not access_token or len(access_token) < 10:
+            if len(session_data['access_token']) < 10:
                 self.logger.debug("Access token appears invalid")
                 return False
-                
+            
+            # Until then, re-checking this same session is a single timestamp comparison
+            self._validity_cache_key = cache_key
+            self._valid_until = valid_until
             return True
             
         except Exception as e:
-            self.logger.error(f"Error validating session: {e}")
+            self.logger.error("Error validating session: %s", e)
             return False
     
     def clear_session(self) -> bool:
         """Clear stored session data"""
         try:
-            if os.path.exists(self.session_file):
-                os.remove(self.session_file)
-                self.logger.info("Session file deleted")
+            for path in (self.packed_session_file, self.session_file):
+                if os.path.exists(path):
+                    os.remove(path)
+                    self.logger.info("Session file deleted: %s", path)
             
             self.session_data = {}
             return True
             
         except Exception as e:
-            self.logger.error(f"Error clearing session: {e}")
+            self.logger.error("Error clearing session: %s", e)
             return False
     
     def refresh_session(self, wb) -> bool:
@@ -195,29 +284,31 @@ class SessionManager:
             #     return False
                 
         except Exception as e:
-            self.logger.error(f"❌ Error in refresh session: {e}")
+            self.logger.error("❌ Error in refresh session: %s", e)
             return False
     
     def get_session_info(self) -> Dict:
         """Get information about current session"""
-        if not self.session_data:
+        session_data = self.session_data
+        if not session_data:
             return {'exists': False}
         
+        get = session_data.get
+        token_expire = get('token_expire')
         info = {
             'exists': True,
-            'access_token_exists': bool(self.session_data.get('access_token')),
-            'refresh_token_exists': bool(self.session_data.get('refresh_token')),
-            'trade_token_exists': bool(self.session_data.get('trade_token')),
-            'account_id': self.session_data.get('account_id'),
-            'saved_at': self.session_data.get('saved_at'),
-            'token_expire': self.session_data.get('token_expire')
+            'access_token_exists': bool(get('access_token')),
+            'refresh_token_exists': bool(get('refresh_token')),
+            'trade_token_exists': bool(get('trade_token')),
+            'account_id': get('account_id'),
+            'saved_at': get('saved_at'),
+            'token_expire': token_expire
         }
         
         # Calculate time until expiration
-        token_expire = self.session_data.get('token_expire', '')
         if token_expire:
             try:
-                expire_time = datetime.fromisoformat(token_expire.replace('+0000', '+00:00'))
+                expire_time = _parse_iso(token_expire)
                 current_time = datetime.now(expire_time.tzinfo)
                 time_until_expire = expire_time - current_time
                 
@@ -258,7 +349,7 @@ class SessionManager:
             # return False
             
         except Exception as e:
-            self.logger.error(f"Error in auto session management: {e}")
+            self.logger.error("Error in auto session management: %s", e)
             # Clear potentially corrupted session data
             self.session_data = {}
             return False
@@ -266,51 +357,55 @@ class SessionManager:
     def backup_session(self, backup_suffix=None) -> bool:
         """Create a backup of current session"""
         try:
-            if not os.path.exists(self.session_file):
+            session_path = self._active_session_file()
+            if session_path is None:
                 self.logger.info("No session file to backup")
                 return False
             
             if backup_suffix is None:
                 backup_suffix = datetime.now().strftime("%Y%m%d_%H%M%S")
             
-            backup_file = f"{self.session_file}.backup_{backup_suffix}"
+            backup_file = f"{session_path}.backup_{backup_suffix}"
             
-            with open(self.session_file, 'r') as source:
-                with open(backup_file, 'w') as backup:
-                    backup.write(source.read())
+            # copyfile uses the kernel's zero-copy path (sendfile) where available
+            shutil.copyfile(session_path, backup_file)
             
-            self.logger.info(f"Session backed up to {backup_file}")
+            self.logger.info("Session backed up to %s", backup_file)
             return True
             
         except Exception as e:
-            self.logger.error(f"Error backing up session: {e}")
+            self.logger.error("Error backing up session: %s", e)
             return False
     
+    def save_and_cleanup(self, wb, max_age_days=7) -> Tuple[bool, int]:
+        """Save the current session and remove stale backups; returns (saved, backups removed)"""
+        return self.save_session(wb), self.cleanup_old_backups(max_age_days)
+    
     def cleanup_old_backups(self, max_age_days=7) -> int:
         """Clean up old session backup files"""
         try:
             cleaned = 0
-            cutoff_time = datetime.now() - timedelta(days=max_age_days)
+            cutoff_time = (datetime.now() - timedelta(days=max_age_days)).timestamp()
             
-            # Look for backup files
+            # Look for backup files; scandir entries carry their own stat, so one pass suffices
             directory = os.path.dirname(self.session_file) or '.'
-            filename_base = os.path.basename(self.session_file)
-            
-            for file in os.listdir(directory):
-                if file.startswith(f"{filename_base}.backup_"):
-                    file_path = os.path.join(directory, file)
-                    file_time = datetime.fromtimestamp(os.path.getmtime(file_path))
-                    
-                    if file_time < cutoff_time:
-                        os.remove(file_path)
+            backup_prefixes = tuple(
+                f"{os.path.basename(path)}.backup_"
+                for path in (self.session_file, self.packed_session_file)
+            )
+            
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith(backup_prefixes) and entry.stat().st_mtime < cutoff_time:
+                        os.remove(entry.path)
                         cleaned += 1
-                        self.logger.debug(f"Cleaned up old backup: {file}")
+                        self.logger.debug("Cleaned up old backup: %s", entry.name)
             
             if cleaned > 0:
-                self.logger.info(f"Cleaned up {cleaned} old session backups")
+                self.logger.info("Cleaned up %s old session backups", cleaned)
             
             return cleaned
             
         except Exception as e:
-            self.logger.error(f"Error cleaning up backups: {e}")
+            self.logger.error("Error cleaning up backups: %s", e)
             return 0
\ No newline at end of file
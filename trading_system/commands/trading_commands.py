@@ -21,6 +21,8 @@ class AuthenticateCommand(Command):
         try:
             # Try existing session first
             if self.session_manager.auto_manage_session(self.wb):
+                # Loading the session already re-initialized the account context
+                self.login_manager.mark_verified()
                 if self.login_manager.check_login_status():
                     return CommandResult(
                         success=True,
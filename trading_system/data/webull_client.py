@@ -3,7 +3,6 @@ import yfinance as yf
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
-import time
 
 class DataFetcher:
     """
@@ -29,37 +28,74 @@ class DataFetcher:
             ticker = yf.Ticker(symbol)
             data = ticker.history(period=period)
             
-            if data.empty:
-                print(f"No data found for {symbol}")
-                return pd.DataFrame()
-            
-            # Ensure we have the expected columns
-            expected_columns = ['Open', 'High', 'Low', 'Close', 'Volume']
-            for col in expected_columns:
-                if col not in data.columns:
-                    print(f"Missing column {col} for {symbol}")
-                    return pd.DataFrame()
-            
-            return data[expected_columns]
+            return self._select_ohlcv(data, symbol)
             
         except Exception as e:
             print(f"Error fetching data for {symbol}: {e}")
             return pd.DataFrame()
     
-    def fetch_multiple_stocks(self, symbols: List[str], 
-                            period: str = "3mo") -> Dict[str, pd.DataFrame]:
-        """Fetch data for multiple stocks"""
+    def fetch_stock_data_batch(self, symbols: List[str],
+                               period: str = "3mo") -> Dict[str, pd.DataFrame]:
+        """
+        Fetch stock data for several symbols with a single yfinance download
+        
+        Args:
+            symbols: Stock symbols
+            period: Data period (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)
+        
+        Returns:
+            Dict of symbol -> DataFrame with OHLCV data (symbols without data are omitted)
+        """
         results = {}
+        if not symbols:
+            return results
         
+        try:
+            data = yf.download(
+                list(symbols), period=period, group_by='ticker',
+                auto_adjust=True, threads=True, progress=False
+            )
+        except Exception as e:
+            print(f"Error fetching batch data for {len(symbols)} symbols: {e}")
+            return results
+        
+        multi_ticker = isinstance(data.columns, pd.MultiIndex)
         for symbol in symbols:
-            print(f"Fetching data for {symbol}...")
-            data = self.fetch_stock_data(symbol, period)
-            if not data.empty:
-                results[symbol] = data
-            time.sleep(0.1)  # Rate limiting
+            if multi_ticker:
+                if symbol not in data.columns.get_level_values(0):
+                    print(f"No data found for {symbol}")
+                    continue
+                symbol_data = data[symbol].dropna(how='all')
+            else:
+                symbol_data = data
+            
+            symbol_data = self._select_ohlcv(symbol_data, symbol)
+            if not symbol_data.empty:
+                results[symbol] = symbol_data
         
         return results
     
+    def _select_ohlcv(self, data: pd.DataFrame, symbol: str) -> pd.DataFrame:
+        """Validate and return the OHLCV columns of a price history frame"""
+        if data.empty:
+            print(f"No data found for {symbol}")
+            return pd.DataFrame()
+        
+        # Ensure we have the expected columns
+        expected_columns = ['Open', 'High', 'Low', 'Close', 'Volume']
+        for col in expected_columns:
+            if col not in data.columns:
+                print(f"Missing column {col} for {symbol}")
+                return pd.DataFrame()
+        
+        return data[expected_columns]
+    
+    def fetch_multiple_stocks(self, symbols: List[str], 
+                            period: str = "3mo") -> Dict[str, pd.DataFrame]:
+        """Fetch data for multiple stocks"""
+        print(f"Fetching data for {len(symbols)} symbols...")
+        return self.fetch_stock_data_batch(symbols, period)
+    
     def get_current_price(self, symbol: str) -> float:
         """Get current/latest price for a symbol"""
         try:
@@ -162,6 +162,28 @@ class TechnicalIndicators:
             'quality_score': quality_score
         }
     
+    @staticmethod
+    def classify_gaps(gap_percent: np.ndarray, volume_ratio: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized classify_gap for arrays of gaps
+        
+        Returns:
+            Tuple of (direction, quality) string arrays, matching classify_gap element-wise
+        """
+        gap_size = np.abs(gap_percent)
+        
+        # Size points: SMALL 1, MEDIUM/LARGE 3, EXTREME 0
+        size_points = np.select([gap_size < 0.01, gap_size < 0.05], [1, 3], default=0)
+        
+        # Volume points: HIGH/VERY_HIGH 2, NORMAL 1, LOW 0
+        volume_points = np.select([volume_ratio > 1.5, volume_ratio > 1.0], [2, 1], default=0)
+        
+        quality_score = size_points + volume_points
+        quality = np.select([quality_score >= 4, quality_score >= 2], ['HIGH', 'MEDIUM'], default='LOW')
+        direction = np.where(gap_percent > 0, 'UP', 'DOWN')
+        
+        return direction, quality
+    
     @staticmethod
     def gap_fill_progress(data: pd.DataFrame, gap_open: float, prev_close: float) -> float:
         """
@@ -162,16 +162,17 @@ class TradingSystem:
             from .data.webull_client import DataFetcher
             fetcher = DataFetcher()
             
-            for symbol in stock_list[:10]:  # Limit to 10 for testing
+            # Limit to 10 for testing; fetched in one batched download
+            raw_data = fetcher.fetch_stock_data_batch(stock_list[:10])
+            
+            for symbol, data in raw_data.items():
                 try:
-                    data = fetcher.fetch_stock_data(symbol)
-                    if not data.empty:
-                        # Add technical indicators
-                        data_with_indicators = self._add_technical_indicators(data)
-                        data_dict[symbol] = data_with_indicators
+                    # Add technical indicators
+                    data_with_indicators = self._add_technical_indicators(data)
+                    data_dict[symbol] = data_with_indicators
                         
                 except Exception as e:
-                    self.logger.warning(f"Failed to fetch data for {symbol}: {e}")
+                    self.logger.warning(f"Failed to prepare data for {symbol}: {e}")
                     continue
             
         except ImportError:
@@ -17,6 +17,12 @@ from pytz import timezone
 
 from . import endpoints
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 class webull :
 
     def __init__(self, region_code=None) :
@@ -108,8 +114,7 @@ class webull :
         Build default set of header params
         '''
         headers = self._headers
-        req_id = str(uuid.uuid4().hex)
-        headers['reqid'] = req_id
+        headers['reqid'] = uuid.uuid4().hex
         headers['did'] = self._did
         headers['access_token'] = self._access_token
         if include_trade_token :
@@ -164,7 +169,7 @@ class webull :
         if question_id != '' and question_answer != '' :
             data['accessQuestions'] = '[{"questionId":"' + str(question_id) + '", "answer":"' + str(question_answer) + '"}]'
 
-        response = requests.post(self._urls.login(), json=data, headers=headers, timeout=self.timeout)
+        response = self._session.post(self._urls.login(), json=data, headers=headers, timeout=self.timeout)
         result = response.json()
         if 'accessToken' in result :
             self._access_token = result['accessToken']
@@ -183,7 +188,7 @@ class webull :
                 'accountType': str(account_type),
                 'codeType': int(5)}
 
-        response = requests.post(self._urls.get_mfa(), json=data, headers=self._headers, timeout=self.timeout)
+        response = self._session.post(self._urls.get_mfa(), json=data, headers=self._headers, timeout=self.timeout)
         # data = response.json()
 
         if response.status_code == 200 :
@@ -199,7 +204,7 @@ class webull :
                 'code': str(mfa),
                 'codeType': int(5)}
 
-        response = requests.post(self._urls.check_mfa(), json=data, headers=self._headers, timeout=self.timeout)
+        response = self._session.post(self._urls.check_mfa(), json=data, headers=self._headers, timeout=self.timeout)
         data = response.json()
 
         return data
@@ -210,10 +215,10 @@ class webull :
 
         # seems like webull has a bug/stability issue here:
         time = datetime.now().timestamp() * 1000
-        response = requests.get(self._urls.get_security(username, account_type, self._region_code, 'PRODUCT_LOGIN', time, 0), headers=self._headers, timeout=self.timeout)
+        response = self._session.get(self._urls.get_security(username, account_type, self._region_code, 'PRODUCT_LOGIN', time, 0), headers=self._headers, timeout=self.timeout)
         data = response.json()
         if len(data) == 0 :
-            response = requests.get(self._urls.get_security(username, account_type, self._region_code, 'PRODUCT_LOGIN', time, 1), headers=self._headers, timeout=self.timeout)
+            response = self._session.get(self._urls.get_security(username, account_type, self._region_code, 'PRODUCT_LOGIN', time, 1), headers=self._headers, timeout=self.timeout)
             data = response.json()
 
         return data
@@ -224,10 +229,10 @@ class webull :
 
         # seems like webull has a bug/stability issue here:
         time = datetime.now().timestamp() * 1000
-        response = requests.get(self._urls.next_security(username, account_type, self._region_code, 'PRODUCT_LOGIN', time, 0), headers=self._headers, timeout=self.timeout)
+        response = self._session.get(self._urls.next_security(username, account_type, self._region_code, 'PRODUCT_LOGIN', time, 0), headers=self._headers, timeout=self.timeout)
         data = response.json()
         if len(data) == 0 :
-            response = requests.get(self._urls.next_security(username, account_type, self._region_code, 'PRODUCT_LOGIN', time, 1), headers=self._headers, timeout=self.timeout)
+            response = self._session.get(self._urls.next_security(username, account_type, self._region_code, 'PRODUCT_LOGIN', time, 1), headers=self._headers, timeout=self.timeout)
             data = response.json()
 
         return data
@@ -240,7 +245,7 @@ class webull :
                 'answerList': [{'questionId': str(question_id), 'answer': str(question_answer)}],
                 'event': 'PRODUCT_LOGIN'}
 
-        response = requests.post(self._urls.check_security(), json=data, headers=self._headers, timeout=self.timeout)
+        response = self._session.post(self._urls.check_security(), json=data, headers=self._headers, timeout=self.timeout)
         data = response.json()
 
         return data
@@ -260,7 +265,7 @@ class webull :
         End login session
         '''
         headers = self.build_req_headers()
-        response = requests.get(self._urls.logout(), headers=headers, timeout=self.timeout)
+        response = self._session.get(self._urls.logout(), headers=headers, timeout=self.timeout)
         return response.status_code
 
     def api_login(self, access_token='', refresh_token='', token_expire='', uuid='', mfa=''):
@@ -277,7 +282,7 @@ class webull :
         headers = self.build_req_headers()
         data = {'refreshToken': self._refresh_token}
 
-        response = requests.post(self._urls.refresh_login(self._refresh_token), json=data, headers=headers, timeout=self.timeout)
+        response = self._session.post(self._urls.refresh_login(self._refresh_token), json=data, headers=headers, timeout=self.timeout)
         result = response.json()
         if 'accessToken' in result and result['accessToken'] != '' and result['refreshToken'] != '' and result['tokenExpireTime'] != '':
             self._access_token = result['accessToken']
@@ -307,7 +312,7 @@ class webull :
         '''
         headers = self.build_req_headers()
 
-        response = requests.get(self._urls.user(), headers=headers, timeout=self.timeout)
+        response = self._session.get(self._urls.user(), headers=headers, timeout=self.timeout)
         result = response.json()
 
         return result
@@ -319,8 +324,15 @@ class webull :
         '''
         headers = self.build_req_headers()
 
-        response = requests.get(self._urls.account_id(), headers=headers, timeout=self.timeout)
-        result = response.json()
+        response = self._session.get(self._urls.account_id(), headers=headers, timeout=self.timeout)
+        if ORJSON_AVAILABLE:
+            try:
+                result = orjson.loads(response.content)
+            except orjson.JSONDecodeError as e:
+                # Raise what response.json() would, so callers still see a non-JSON reply as a network error
+                raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos)
+        else:
+            result = response.json()
         #print(result)
         if result['success'] and len(result['data']) > 0 :
             self.zone_var = str(result['data'][int(id)]['rzone'])
@@ -334,7 +346,7 @@ class webull :
         get important details of account, positions, portfolio stance...etc
         '''
         headers = self.build_req_headers()
-        response = requests.get(self._urls.account(self._account_id), headers=headers, timeout=self.timeout)
+        response = self._session.get(self._urls.account(self._account_id), headers=headers, timeout=self.timeout)
         result = response.json()
         return result
 
@@ -362,7 +374,7 @@ class webull :
         headers = self.build_req_headers(include_trade_token=True, include_time=True)
         data = {'pageIndex': index,
                 'pageSize': size}
-        response = requests.post(self._urls.account_activities(self._account_id), json=data, headers=headers, timeout=self.timeout)
+        response = self._session.post(self._urls.account_activities(self._account_id), json=data, headers=headers, timeout=self.timeout)
         return response.json()
 
     def get_current_orders(self) :
@@ -378,7 +390,7 @@ class webull :
         status = Cancelled / Filled / Working / Partially Filled / Pending / Failed / All
         '''
         headers = self.build_req_headers(include_trade_token=True, include_time=True)
-        response = requests.get(self._urls.orders(self._account_id, count) + str(status), headers=headers, timeout=self.timeout)
+        response = self._session.get(self._urls.orders(self._account_id, count) + str(status), headers=headers, timeout=self.timeout)
         return response.json()
 
     def get_trade_token(self, password=''):
@@ -393,7 +405,7 @@ class webull :
         md5_hash = hashlib.md5(password)
         data = {'pwd': md5_hash.hexdigest()}
 
-        response = requests.post(self._urls.trade_token(), json=data, headers=headers, timeout=self.timeout)
+        response = self._session.post(self._urls.trade_token(), json=data, headers=headers, timeout=self.timeout)
         result = response.json()
         if 'tradeToken' in result :
             self._trade_token = result['tradeToken']
@@ -409,7 +421,7 @@ class webull :
         headers = self.build_req_headers()
         ticker_id = 0
         if stock and isinstance(stock, str):
-            response = requests.get(self._urls.stock_id(stock, self._region_code), headers=headers, timeout=self.timeout)
+            response = self._session.get(self._urls.stock_id(stock, self._region_code), headers=headers, timeout=self.timeout)
             result = response.json()
             if result.get('data') :
                 for item in result['data'] : # implies multiple tickers, but only assigns last one?
@@ -442,7 +454,7 @@ class webull :
                 tId = str(self.get_ticker(stock))
             except ValueError as _e:
                 raise ValueError("Could not find ticker for stock {}".format(stock))
-        response = requests.get(self._urls.stock_detail(tId), headers=headers, timeout=self.timeout)
+        response = self._session.get(self._urls.stock_detail(tId), headers=headers, timeout=self.timeout)
         result = response.json()
         return result
 
@@ -456,7 +468,7 @@ class webull :
         if not region_code :
             region_code = self._region_code
 
-        response = requests.get(self._urls.get_all_tickers(region_code, region_code), headers=headers, timeout=self.timeout)
+        response = self._session.get(self._urls.get_all_tickers(region_code, region_code), headers=headers, timeout=self.timeout)
         result = response.json()
         return result
 
@@ -477,7 +489,7 @@ class webull :
                 tId = str(self.get_ticker(stock))
             except ValueError as _e:
                 raise ValueError("Could not find ticker for stock {}".format(stock))
-        response = requests.get(self._urls.quotes(tId), headers=headers, timeout=self.timeout)
+        response = self._session.get(self._urls.quotes(tId), headers=headers, timeout=self.timeout)
         result = response.json()
         return result
 
@@ -527,7 +539,7 @@ class webull :
             data['trailingStopStep'] = float(trial_value)
             data['trailingType'] = str(trial_type)
 
-        response = requests.post(self._urls.place_orders(self._account_id), json=data, headers=headers, timeout=self.timeout)
+        response = self._session.post(self._urls.place_orders(self._account_id), json=data, headers=headers, timeout=self.timeout)
         #print(response.json())
         return response.json()
 
@@ -539,7 +551,7 @@ class webull :
         '''
         headers = self.build_req_headers(include_trade_token=True, include_time=True)
         data = {}
-        response = requests.post(self._urls.cancel_order(self._account_id) + str(order_id) + '/' + str(uuid.uuid4()), json=data, headers=headers, timeout=self.timeout)
+        response = self._session.post(self._urls.cancel_order(self._account_id) + str(order_id) + '/' + str(uuid.uuid4()), json=data, headers=headers, timeout=self.timeout)
         result = response.json()
         return result['success']
 
@@ -564,7 +576,7 @@ class webull :
             ]
         }
 
-        response1 = requests.post(self._urls.check_otoco_orders(self._account_id), json=data1, headers=headers, timeout=self.timeout)
+        response1 = self._session.post(self._urls.check_otoco_orders(self._account_id), json=data1, headers=headers, timeout=self.timeout)
         result1 = response1.json()
 
         if result1['forward'] :
@@ -581,7 +593,7 @@ class webull :
                 'serialId': str(uuid.uuid4())
             }
 
-            response2 = requests.post(self._urls.place_otoco_orders(self._account_id), json=data2, headers=headers, timeout=self.timeout)
+            response2 = self._session.post(self._urls.place_otoco_orders(self._account_id), json=data2, headers=headers, timeout=self.timeout)
 
             # print('Resp 2: {}'.format(response2))
             return response2.json()
@@ -611,7 +623,7 @@ class webull :
             'serialId': str(uuid.uuid4())
         }
 
-        response = requests.post(self._urls.modify_otoco_orders(self._account_id), json=data, headers=headers, timeout=self.timeout)
+        response = self._session.post(self._urls.modify_otoco_orders(self._account_id), json=data, headers=headers, timeout=self.timeout)
 
         # print('Resp: {}'.format(response))
         return response.json()
@@ -623,7 +635,7 @@ class webull :
         headers = self.build_req_headers(include_trade_token=True, include_time=True)
         # data = { 'serialId': str(uuid.uuid4()), 'cancelOrders': [str(order_id)]}
         data = {}
-        response = requests.post(self._urls.cancel_otoco_orders(self._account_id, combo_id), json=data, headers=headers, timeout=self.timeout)
+        response = self._session.post(self._urls.cancel_otoco_orders(self._account_id, combo_id), json=data, headers=headers, timeout=self.timeout)
         return response.json()
     
 
@@ -667,7 +679,7 @@ class webull :
         print(f"🔍 DEBUG: Making validation request to: {self._urls.check_otoco_orders(self._account_id)}")
         
         try:
-            response1 = requests.post(self._urls.check_otoco_orders(self._account_id), json=data1, headers=headers, timeout=self.timeout)
+            response1 = self._session.post(self._urls.check_otoco_orders(self._account_id), json=data1, headers=headers, timeout=self.timeout)
             print(f"🔍 DEBUG: Response status code: {response1.status_code}")
             
             if response1.status_code != 200:
@@ -715,7 +727,7 @@ class webull :
             print(json.dumps(data2, indent=2))
             
             try:
-                response2 = requests.post(self._urls.place_otoco_orders(self._account_id), json=data2, headers=headers, timeout=self.timeout)
+                response2 = self._session.post(self._urls.place_otoco_orders(self._account_id), json=data2, headers=headers, timeout=self.timeout)
                 print(f"🔍 DEBUG: Order placement response status: {response2.status_code}")
                 
                 # Always print the response for debugging
@@ -790,7 +802,7 @@ class webull :
             'timeInForce': enforce
         }
 
-        response = requests.post(self._urls.place_orders(self._account_id), json=data, headers=headers, timeout=self.timeout)
+        response = self._session.post(self._urls.place_orders(self._account_id), json=data, headers=headers, timeout=self.timeout)
         return response.json()
 
     '''
@@ -810,7 +822,7 @@ class webull :
                 raise ValueError("Could not find ticker for stock {}".format(stock))
         headers = self.build_req_headers()
         params = {'tickerId': tId, 'derivativeIds': optionId}
-        return requests.get(self._urls.option_quotes(), params=params, headers=headers, timeout=self.timeout).json()
+        return self._session.get(self._urls.option_quotes(), params=params, headers=headers, timeout=self.timeout).json()
 
     def get_options_expiration_dates(self, stock=None, count=-1):
         '''
@@ -821,12 +833,12 @@ class webull :
                 'direction': 'all',
                 'tickerId': self.get_ticker(stock)}
 
-        res = requests.post(self._urls.options_exp_dat_new(), json=data, headers=headers, timeout=self.timeout).json()
+        res = self._session.post(self._urls.options_exp_dat_new(), json=data, headers=headers, timeout=self.timeout).json()
         r_data = []
         for entry in res['expireDateList'] :
             r_data.append(entry['from'])
 
-        # return requests.get(self._urls.options_exp_date(self.get_ticker(stock)), params=data, headers=headers, timeout=self.timeout).json()['expireDateList']
+        # return self._session.get(self._urls.options_exp_date(self.get_ticker(stock)), params=data, headers=headers, timeout=self.timeout).json()['expireDateList']
         return r_data
 
     def get_options(self, stock=None, count=-1, includeWeekly=1, direction='all', expireDate=None, queryAll=0):
@@ -854,7 +866,7 @@ class webull :
                 'direction': direction,
                 'tickerId': self.get_ticker(stock)}
 
-        res = requests.post(self._urls.options_exp_dat_new(), json=data, headers=headers, timeout=self.timeout).json()
+        res = self._session.post(self._urls.options_exp_dat_new(), json=data, headers=headers, timeout=self.timeout).json()
         t_data = []
         for entry in res['expireDateList'] :
             if str(entry['from']['date']) == expireDate :
@@ -887,7 +899,7 @@ class webull :
         #           'unSymbol': stock,
         #           'queryAll': queryAll}
         #
-        # data = requests.get(self._urls.options(self.get_ticker(stock)), params=params, headers=headers, timeout=self.timeout).json()
+        # data = self._session.get(self._urls.options(self.get_ticker(stock)), params=params, headers=headers, timeout=self.timeout).json()
         #
         # return data['data']
 
@@ -928,7 +940,7 @@ class webull :
             data['lmtPrice'] = float(lmtPrice)
             data['auxPrice'] = float(stpPrice)
 
-        response = requests.post(self._urls.place_option_orders(self._account_id), json=data, headers=headers, timeout=self.timeout)
+        response = self._session.post(self._urls.place_option_orders(self._account_id), json=data, headers=headers, timeout=self.timeout)
         if response.status_code != 200:
             raise Exception('place_option_order failed', response.status_code, response.reason)
         return response.json()
@@ -962,7 +974,7 @@ class webull :
             data['auxPrice'] = stpPrice or order['auxPrice']
             data['lmtPrice'] = lmtPrice or order['lmtPrice']
 
-        response = requests.post(self._urls.replace_option_orders(self._account_id), json=data, headers=headers, timeout=self.timeout)
+        response = self._session.post(self._urls.replace_option_orders(self._account_id), json=data, headers=headers, timeout=self.timeout)
         if response.status_code != 200:
             raise Exception('replace_option_order failed', response.status_code, response.reason)
         return True
@@ -980,7 +992,7 @@ class webull :
         get if stock is tradable
         '''
         headers = self.build_req_headers()
-        response = requests.get(self._urls.is_tradable(self.get_ticker(stock)), headers=headers, timeout=self.timeout)
+        response = self._session.get(self._urls.is_tradable(self.get_ticker(stock)), headers=headers, timeout=self.timeout)
 
         return response.json()
 
@@ -990,7 +1002,7 @@ class webull :
         '''
         headers = self.build_req_headers()
 
-        response = requests.get(self._urls.list_alerts(), headers=headers, timeout=self.timeout)
+        response = self._session.get(self._urls.list_alerts(), headers=headers, timeout=self.timeout)
         result = response.json()
         if 'data' in result:
             return result.get('data', [])
@@ -1014,7 +1026,7 @@ class webull :
                 rule['active'] = 'off'
             alert['eventWarningInput'] = alert['eventWarning']
 
-        response = requests.post(self._urls.remove_alert(), json=alert, headers=headers, timeout=self.timeout)
+        response = self._session.post(self._urls.remove_alert(), json=alert, headers=headers, timeout=self.timeout)
         if response.status_code != 200:
             raise Exception('alerts_remove failed', response.status_code, response.reason)
         return True
@@ -1079,7 +1091,7 @@ class webull :
         except Exception as e:
             print(f'failed to build alerts_add payload data. error: {e}')
 
-        response = requests.post(self._urls.add_alert(), json=data, headers=headers, timeout=self.timeout)
+        response = self._session.post(self._urls.add_alert(), json=data, headers=headers, timeout=self.timeout)
         if response.status_code != 200:
             raise Exception('alerts_add failed', response.status_code, response.reason)
         return True
@@ -1093,7 +1105,7 @@ class webull :
         '''
         headers = self.build_req_headers()
 
-        response = requests.get(self._urls.active_gainers_losers(direction, self._region_code, rank_type, count), headers=headers, timeout=self.timeout)
+        response = self._session.get(self._urls.active_gainers_losers(direction, self._region_code, rank_type, count), headers=headers, timeout=self.timeout)
         result = response.json()
 
         return result
@@ -1132,7 +1144,7 @@ class webull :
             jdict['sort']['desc'] = 'true'
 
         # jdict = self._ddict2dict(jdict)
-        response = requests.post(self._urls.screener(), json=jdict, timeout=self.timeout)
+        response = self._session.post(self._urls.screener(), json=jdict, timeout=self.timeout)
         result = response.json()
         return result
 
@@ -1141,7 +1153,7 @@ class webull :
         get analysis info and returns a dict of analysis ratings
         '''
         headers = self.build_req_headers()
-        return requests.get(self._urls.analysis(self.get_ticker(stock)), headers=headers, timeout=self.timeout).json()
+        return self._session.get(self._urls.analysis(self.get_ticker(stock)), headers=headers, timeout=self.timeout).json()
 
     def get_capital_flow(self, stock=None, tId=None, show_hist=True):
         '''
@@ -1158,7 +1170,7 @@ class webull :
             tId = self.get_ticker(stock)
         else:
             raise ValueError('Must provide a stock symbol or a stock id')
-        return requests.get(self._urls.analysis_capital_flow(tId, show_hist), headers=headers, timeout=self.timeout).json()
+        return self._session.get(self._urls.analysis_capital_flow(tId, show_hist), headers=headers, timeout=self.timeout).json()
 
     def get_etf_holding(self, stock=None, tId=None, has_num=0, count=50):
         '''
@@ -1176,7 +1188,7 @@ class webull :
             tId = self.get_ticker(stock)
         else:
             raise ValueError('Must provide a stock symbol or a stock id')
-        return requests.get(self._urls.analysis_etf_holding(tId, has_num, count), headers=headers, timeout=self.timeout).json()
+        return self._session.get(self._urls.analysis_etf_holding(tId, has_num, count), headers=headers, timeout=self.timeout).json()
 
     def get_institutional_holding(self, stock=None, tId=None):
         '''
@@ -1192,7 +1204,7 @@ class webull :
             tId = self.get_ticker(stock)
         else:
             raise ValueError('Must provide a stock symbol or a stock id')
-        return requests.get(self._urls.analysis_institutional_holding(tId), headers=headers, timeout=self.timeout).json()
+        return self._session.get(self._urls.analysis_institutional_holding(tId), headers=headers, timeout=self.timeout).json()
 
     def get_short_interest(self, stock=None, tId=None):
         '''
@@ -1208,14 +1220,14 @@ class webull :
             tId = self.get_ticker(stock)
         else:
             raise ValueError('Must provide a stock symbol or a stock id')
-        return requests.get(self._urls.analysis_shortinterest(tId), headers=headers, timeout=self.timeout).json()
+        return self._session.get(self._urls.analysis_shortinterest(tId), headers=headers, timeout=self.timeout).json()
 
     def get_financials(self, stock=None):
         '''
         get financials info and returns a dict of financial info
         '''
         headers = self.build_req_headers()
-        return requests.get(self._urls.fundamentals(self.get_ticker(stock)), headers=headers, timeout=self.timeout).json()
+        return self._session.get(self._urls.fundamentals(self.get_ticker(stock)), headers=headers, timeout=self.timeout).json()
 
     def get_news(self, stock=None, tId=None, Id=0, items=20):
         '''
@@ -1231,7 +1243,7 @@ class webull :
             tId = self.get_ticker(stock)
         else:
             raise ValueError('Must provide a stock symbol or a stock id')
-        return requests.get(self._urls.news(tId, Id, items), headers=headers, timeout=self.timeout).json()
+        return self._session.get(self._urls.news(tId, Id, items), headers=headers, timeout=self.timeout).json()
 
     def get_bars(self, stock=None, tId=None, interval='m1', count=1, extendTrading=0, timeStamp=None):
         '''
@@ -1257,7 +1269,7 @@ class webull :
         params = {'extendTrading': extendTrading}
         df = DataFrame(columns=['open', 'high', 'low', 'close', 'volume', 'vwap'])
         df.index.name = 'timestamp'
-        response = requests.get(
+        response = self._session.get(
             self._urls.bars(tId, interval, count, timeStamp),
             params=params,
             headers=headers,
@@ -1300,7 +1312,7 @@ class webull :
         params = {'type': interval, 'count': count, 'extendTrading': extendTrading, 'timestamp': timeStamp}
         df = DataFrame(columns=['open', 'high', 'low', 'close', 'volume', 'vwap'])
         df.index.name = 'timestamp'
-        response = requests.get(self._urls.bars_crypto(tId), params=params, headers=headers, timeout=self.timeout)
+        response = self._session.get(self._urls.bars_crypto(tId), params=params, headers=headers, timeout=self.timeout)
         result = response.json()
         time_zone = timezone(result[0]['timeZone'])
         for row in result[0]['data']:
@@ -1336,7 +1348,7 @@ class webull :
         params = {'type': interval, 'count': count, 'direction': direction, 'timestamp': timeStamp}
         df = DataFrame(columns=['open', 'high', 'low', 'close', 'volume', 'vwap'])
         df.index.name = 'timestamp'
-        response = requests.get(self._urls.options_bars(derivativeId), params=params, headers=headers, timeout=self.timeout)
+        response = self._session.get(self._urls.options_bars(derivativeId), params=params, headers=headers, timeout=self.timeout)
         result = response.json()
         time_zone = timezone(result[0]['timeZone'])
         for row in result[0]['data'] :
@@ -1378,7 +1390,7 @@ class webull :
             raise ValueError('Must provide a stock symbol or a stock id')
 
         params = {'type': 'm1', 'count': 1, 'extendTrading': 0}
-        response = requests.get(self._urls.bars(tId), params=params, headers=headers, timeout=self.timeout)
+        response = self._session.get(self._urls.bars(tId), params=params, headers=headers, timeout=self.timeout)
         result = response.json()
         time_zone = timezone(result[0]['timeZone'])
         last_trade_date = datetime.fromtimestamp(int(result[0]['data'][0].split(',')[0])).astimezone(time_zone)
@@ -1413,7 +1425,7 @@ class webull :
         ''' Return account's incoming dividend info '''
         headers = self.build_req_headers()
         data = {}
-        response = requests.post(self._urls.dividends(self._account_id), json=data, headers=headers, timeout=self.timeout)
+        response = self._session.post(self._urls.dividends(self._account_id), json=data, headers=headers, timeout=self.timeout)
         return response.json()
 
     def get_five_min_ranking(self, extendTrading=0):
@@ -1423,7 +1435,7 @@ class webull :
         rank = []
         headers = self.build_req_headers()
         params = {'regionId': self._region_code, 'userRegionId': self._region_code, 'platform': 'pc', 'limitCards': 'latestActivityPc'}
-        response = requests.get(self._urls.rankings(), params=params, headers=headers, timeout=self.timeout)
+        response = self._session.get(self._urls.rankings(), params=params, headers=headers, timeout=self.timeout)
         result = response.json()[0].get('data')
         if extendTrading:
             for data in result:
@@ -1441,7 +1453,7 @@ class webull :
         """
         headers = self.build_req_headers()
         params = {'version': 0}
-        response = requests.get(self._urls.portfolio_lists(), params=params, headers=headers, timeout=self.timeout)
+        response = self._session.get(self._urls.portfolio_lists(), params=params, headers=headers, timeout=self.timeout)
 
         if not as_list_symbols :
             return response.json()['portfolioList']
@@ -1483,7 +1495,7 @@ class webull :
         else:
             raise ValueError('Must provide a stock symbol or a stock id')
         headers = self.build_req_headers()
-        response = requests.get(self._urls.press_releases(tId, typeIds, num), headers=headers, timeout=self.timeout)
+        response = self._session.get(self._urls.press_releases(tId, typeIds, num), headers=headers, timeout=self.timeout)
         result = response.json()
 
         return result
@@ -1497,7 +1509,7 @@ class webull :
         if start_date is None:
             start_date = datetime.today().strftime('%Y-%m-%d')
         headers = self.build_req_headers()
-        response = requests.get(self._urls.calendar_events(event, self._region_code, start_date, page, num), headers=headers, timeout=self.timeout)
+        response = self._session.get(self._urls.calendar_events(event, self._region_code, start_date, page, num), headers=headers, timeout=self.timeout)
         result = response.json()
 
         return result
@@ -1511,13 +1523,13 @@ class paper_webull(webull):
     def get_account(self):
         ''' Get important details of paper account '''
         headers = self.build_req_headers()
-        response = requests.get(self._urls.paper_account(self._account_id), headers=headers, timeout=self.timeout)
+        response = self._session.get(self._urls.paper_account(self._account_id), headers=headers, timeout=self.timeout)
         return response.json()
 
     def get_account_id(self):
         ''' Get paper account id: call this before paper account actions'''
         headers = self.build_req_headers()
-        response = requests.get(self._urls.paper_account_id(), headers=headers, timeout=self.timeout)
+        response = self._session.get(self._urls.paper_account_id(), headers=headers, timeout=self.timeout)
         result = response.json()
         if result is not None and len(result) > 0 and 'id' in result[0]:
             id = result[0]['id']
@@ -1532,7 +1544,7 @@ class paper_webull(webull):
 
     def get_history_orders(self, status='Cancelled', count=20):
         headers = self.build_req_headers(include_trade_token=True, include_time=True)
-        response = requests.get(self._urls.paper_orders(self._account_id, count) + str(status), headers=headers, timeout=self.timeout)
+        response = self._session.get(self._urls.paper_orders(self._account_id, count) + str(status), headers=headers, timeout=self.timeout)
         return response.json()
 
     def get_positions(self):
@@ -1565,7 +1577,7 @@ class paper_webull(webull):
         if orderType == 'MKT':
             data['outsideRegularTradingHour'] = False
 
-        response = requests.post(self._urls.paper_place_order(self._account_id, tId), json=data, headers=headers, timeout=self.timeout)
+        response = self._session.post(self._urls.paper_place_order(self._account_id, tId), json=data, headers=headers, timeout=self.timeout)
         return response.json()
 
     def modify_order(self, order, price=0, action='BUY', orderType='LMT', enforce='GTC', quant=0, outsideRegularTradingHour=True):
@@ -1588,7 +1600,7 @@ class paper_webull(webull):
         else:
             data['quantity'] = int(quant)
 
-        response = requests.post(self._urls.paper_modify_order(self._account_id, order['orderId']), json=data, headers=headers, timeout=self.timeout)
+        response = self._session.post(self._urls.paper_modify_order(self._account_id, order['orderId']), json=data, headers=headers, timeout=self.timeout)
         if response:
             return True
         else:
@@ -1598,13 +1610,13 @@ class paper_webull(webull):
     def cancel_order(self, order_id):
         ''' Cancel a paper account order. '''
         headers = self.build_req_headers()
-        response = requests.post(self._urls.paper_cancel_order(self._account_id, order_id), headers=headers, timeout=self.timeout)
+        response = self._session.post(self._urls.paper_cancel_order(self._account_id, order_id), headers=headers, timeout=self.timeout)
         return bool(response)
 
     def get_social_posts(self, topic, num=100):
         headers = self.build_req_headers()
 
-        response = requests.get(self._urls.social_posts(topic, num), headers=headers, timeout=self.timeout)
+        response = self._session.get(self._urls.social_posts(topic, num), headers=headers, timeout=self.timeout)
         result = response.json()
         return result
 
@@ -1612,7 +1624,7 @@ class paper_webull(webull):
     def get_social_home(self, topic, num=100):
         headers = self.build_req_headers()
 
-        response = requests.get(self._urls.social_home(topic, num), headers=headers, timeout=self.timeout)
+        response = self._session.get(self._urls.social_home(topic, num), headers=headers, timeout=self.timeout)
         result = response.json()
         return result
 